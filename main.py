@@ -25,7 +25,7 @@ def main():
     print("\n🔍 Step 2: Running Analysis...")
     from analysis_functions import create_analyzer
     
-    analyzer = create_analyzer()
+    analyzer = create_analyzer(cache_dir='data/processed/analysis_cache')
     insights = analyzer.run_comprehensive_analysis()
     
     # Step 3: Generate Visualizations
@@ -11,17 +11,167 @@ import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
 import seaborn as sns
-from datetime import datetime, timedelta
+from scipy.stats import rankdata
+from datetime import date, datetime, timedelta
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Tuple, Optional
+import os
+import json
+import hashlib
+
+try:
+    import dask.dataframe as dd
+except ImportError:
+    dd = None
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# Parquet result caching needs pyarrow; without it analyses always recompute
+try:
+    import pyarrow  # noqa: F401
+    PARQUET_AVAILABLE = True
+except ImportError:
+    PARQUET_AVAILABLE = False
 
 warnings.filterwarnings('ignore')
 
+DATE_FORMAT = '%Y-%m-%d'
+NS_PER_DAY = 86_400 * 10**9
+DAY_ORDER = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+SEGMENT_LABELS = np.array(['VIP', 'High Value', 'Medium Value', 'Low Value'])
+QUINTILES = [0.2, 0.4, 0.6, 0.8]
+
+# Order tables at least this large are grouped on Dask partitions (when Dask is installed)
+DASK_MIN_ROWS = 1_000_000
+
+# Explicit column types for the analysis inputs (skips per-column type inference)
+ORDERS_DTYPES = {
+    'order_id': 'int64', 'customer_id': 'int64', 'item_id': 'int64',
+    'quantity': 'int64', 'total_amount': 'float64', 'order_time': 'str'
+}
+VISITS_DTYPES = {
+    'visit_id': 'int64', 'customer_id': 'int64', 'visit_time': 'str',
+    'party_size': 'int64', 'duration_minutes': 'int64'
+}
+SATISFACTION_DTYPES = {
+    'survey_id': 'int64', 'customer_id': 'int64', 'overall_rating': 'int64',
+    'food_quality': 'int64', 'service_quality': 'int64', 'atmosphere': 'int64',
+    'would_recommend': 'int64'
+}
+MENU_DTYPES = {
+    'item_id': 'int64', 'item_name': 'str', 'category': 'str', 'price': 'float64'
+}
+
+# Cached analyses whose results depend on the current date (recency is measured up to today)
+DATE_DEPENDENT_ANALYSES = {'customer_segments'}
+
+# Analysis input files, relative to the data directory
+INPUT_FILES = [
+    ('processed/cleaned_orders.csv', ORDERS_DTYPES, ['order_date']),
+    ('processed/cleaned_visits.csv', VISITS_DTYPES, ['visit_date']),
+    ('processed/cleaned_satisfaction.csv', SATISFACTION_DTYPES, ['survey_date']),
+    ('raw/menu_items.csv', MENU_DTYPES, None)
+]
+
+def _quintile_scores(values: np.ndarray) -> np.ndarray:
+    """
+    Score values 1-5 by quintile, matching pd.qcut(values, 5) bins
+    
+    Bins are right-closed like qcut, so a value equal to an edge lands in the lower bin.
+    """
+    edges = np.quantile(values, QUINTILES)
+    return (np.searchsorted(edges, values, side='left') + 1).astype(np.int8)
+
+def _segment_codes(spent: np.ndarray, order_frequency: np.ndarray) -> np.ndarray:
+    """Segment index into SEGMENT_LABELS for each customer (first matching threshold wins)"""
+    segment_conditions = [
+        (spent >= 500) & (order_frequency >= 10),
+        (spent >= 300) & (order_frequency >= 5),
+        (spent >= 100) & (order_frequency >= 3)
+    ]
+    return np.select(segment_conditions, [0, 1, 2], default=3).astype(np.int8)
+
+def _score_customers_loop(recency, frequency_rank, spent, order_frequency,
+                          recency_edges, frequency_edges, spent_edges):
+    """
+    Fused single pass over customers computing R/F/M scores, the combined RFM score and
+    the segment code; same results as the vectorized path, compiled when Numba is installed
+    """
+    n = recency.shape[0]
+    recency_score = np.empty(n, np.int8)
+    frequency_score = np.empty(n, np.int8)
+    monetary_score = np.empty(n, np.int8)
+    rfm_score = np.empty(n, np.int16)
+    segment = np.empty(n, np.int8)
+    
+    for i in range(n):
+        # Count edges strictly below each value (right-closed quintile bins, as in _quintile_scores)
+        r = 5
+        f = 1
+        m = 1
+        for j in range(4):
+            if recency[i] > recency_edges[j]:
+                r -= 1
+            if frequency_rank[i] > frequency_edges[j]:
+                f += 1
+            if spent[i] > spent_edges[j]:
+                m += 1
+        recency_score[i] = r
+        frequency_score[i] = f
+        monetary_score[i] = m
+        rfm_score[i] = r * 100 + f * 10 + m
+        
+        if spent[i] >= 500 and order_frequency[i] >= 10:
+            segment[i] = 0
+        elif spent[i] >= 300 and order_frequency[i] >= 5:
+            segment[i] = 1
+        elif spent[i] >= 100 and order_frequency[i] >= 3:
+            segment[i] = 2
+        else:
+            segment[i] = 3
+            
+    return recency_score, frequency_score, monetary_score, rfm_score, segment
+
+_score_customers_jit = njit(cache=True)(_score_customers_loop) if njit is not None else None
+
+def _score_customers(recency: np.ndarray, frequency_rank: np.ndarray, spent: np.ndarray,
+                     order_frequency: np.ndarray) -> Tuple[np.ndarray, ...]:
+    """
+    RFM quintile scores (1-5), combined RFM score and segment code per customer
+    
+    Uses the fused Numba kernel when available, otherwise vectorized NumPy.
+    """
+    if _score_customers_jit is not None:
+        return _score_customers_jit(
+            recency, frequency_rank, spent, order_frequency,
+            np.quantile(recency, QUINTILES), np.quantile(frequency_rank, QUINTILES), np.quantile(spent, QUINTILES)
+        )
+        
+    recency_score = 6 - _quintile_scores(recency)
+    frequency_score = _quintile_scores(frequency_rank)
+    monetary_score = _quintile_scores(spent)
+    rfm_score = recency_score.astype(np.int16) * 100 + frequency_score.astype(np.int16) * 10 + monetary_score
+    return recency_score, frequency_score, monetary_score, rfm_score, _segment_codes(spent, order_frequency)
+
+def _downcast_integers(df: pd.DataFrame) -> None:
+    """
+    Downcast integer columns in place to the smallest dtype that fits their range
+    
+    Float columns are left as float64 so currency totals keep their cents.
+    """
+    for column in df.select_dtypes(include='integer').columns:
+        df[column] = pd.to_numeric(df[column], downcast='integer')
+
 class RestaurantAnalyzer:
     """Comprehensive restaurant data analysis class"""
     
     def __init__(self, orders_df: pd.DataFrame, visits_df: pd.DataFrame, 
-                 satisfaction_df: pd.DataFrame, menu_df: pd.DataFrame):
+                 satisfaction_df: pd.DataFrame, menu_df: pd.DataFrame,
+                 cache_dir: Optional[str] = None, data_hash: Optional[str] = None):
         """
         Initialize analyzer with restaurant datasets
         
@@ -30,37 +180,156 @@ class RestaurantAnalyzer:
             visits_df: Customer visits data  
             satisfaction_df: Customer satisfaction surveys
             menu_df: Menu items data
+            cache_dir: Directory for Parquet-cached analysis results (None disables caching)
+            data_hash: Digest of the input file contents; cached results from other inputs are
+                ignored, and without a digest nothing is cached
         """
         self.orders = orders_df
         self.visits = visits_df
         self.satisfaction = satisfaction_df
         self.menu = menu_df
         self.insights = {}
+        self.cache_dir = cache_dir if PARQUET_AVAILABLE and data_hash is not None else None
+        self.data_hash = data_hash
         
         # Ensure proper data types
         self._prepare_data()
         
     def _prepare_data(self):
         """Prepare data with proper types and derived columns"""
-        # Convert date columns
+        # Convert date columns (explicit format skips inference, cache dedupes repeated dates)
         if 'order_date' in self.orders.columns:
-            self.orders['order_date'] = pd.to_datetime(self.orders['order_date'])
+            self.orders['order_date'] = pd.to_datetime(self.orders['order_date'], format=DATE_FORMAT, cache=True)
         if 'visit_date' in self.visits.columns:
-            self.visits['visit_date'] = pd.to_datetime(self.visits['visit_date'])
+            self.visits['visit_date'] = pd.to_datetime(self.visits['visit_date'], format=DATE_FORMAT, cache=True)
         if 'survey_date' in self.satisfaction.columns:
-            self.satisfaction['survey_date'] = pd.to_datetime(self.satisfaction['survey_date'])
+            self.satisfaction['survey_date'] = pd.to_datetime(self.satisfaction['survey_date'], format=DATE_FORMAT, cache=True)
             
-        # Add time-based features to orders
+        # Add time-based features to orders (one day-resolution view instead of separate .dt passes)
         if 'order_date' in self.orders.columns:
-            self.orders['year'] = self.orders['order_date'].dt.year
-            self.orders['month'] = self.orders['order_date'].dt.month
-            self.orders['day_of_week'] = self.orders['order_date'].dt.dayofweek
-            self.orders['day_name'] = self.orders['order_date'].dt.day_name()
+            order_days = self.orders['order_date'].to_numpy().astype('datetime64[D]')
+            order_months = order_days.astype('datetime64[M]').astype(np.int64)
+            self.orders['year'] = (order_months // 12 + 1970).astype(np.int16)
+            self.orders['month'] = (order_months % 12 + 1).astype(np.int8)
+            # 1970-01-01 was a Thursday (dayofweek 3, Monday=0)
+            self.orders['day_of_week'] = ((order_days.astype(np.int64) + 3) % 7).astype(np.int8)
+            self.orders['day_name'] = pd.Categorical.from_codes(self.orders['day_of_week'], categories=DAY_ORDER, ordered=True)
+            
+        # Store repeated menu labels as categoricals (carried through the menu merge)
+        for column in ['item_name', 'category']:
+            if column in self.menu.columns:
+                self.menu[column] = self.menu[column].astype('category')
             
-        # Add hour feature if time data exists
+        # Add hour feature if time data exists (HH:MM strings, so the hour is the leading field)
         if 'order_time' in self.orders.columns:
-            self.orders['hour'] = pd.to_datetime(self.orders['order_time'], format='%H:%M').dt.hour
+            self.orders['hour'] = self.orders['order_time'].str.split(':', n=1).str[0].astype('int8')
+            
+        # Shrink integer columns to the smallest dtype that holds their values
+        for df in [self.orders, self.visits, self.satisfaction, self.menu]:
+            _downcast_integers(df)
+            
+        # Partition large order tables once so every analysis shares the same Dask frame
+        self.orders_dd = None
+        if dd is not None and len(self.orders) >= DASK_MIN_ROWS:
+            self.orders_dd = dd.from_pandas(self.orders, npartitions=os.cpu_count() or 1)
+            
+        # Per-customer order aggregates, filled on first use
+        self._customer_agg = None
+            
+    def _orders_groupby_agg(self, by, aggregations: Dict) -> pd.DataFrame:
+        """Group and aggregate the orders table, in parallel on Dask for large tables"""
+        if self.orders_dd is None:
+            return self.orders.groupby(by, observed=True).agg(aggregations)
+
+        # Dask has no 'nunique' inside agg(), so build each reduction separately
+        # and compute them together in a single pass over the partitions
+        grouped = self.orders_dd.groupby(by, observed=True)
+        reductions = {}
+        for column, funcs in aggregations.items():
+            for func in ([funcs] if isinstance(funcs, str) else funcs):
+                reductions[(column, func)] = grouped[column].nunique() if func == 'nunique' else grouped[column].agg(func)
+
+        results = pd.concat(dd.compute(*reductions.values()), axis=1).sort_index()
+        if any(not isinstance(funcs, str) for funcs in aggregations.values()):
+            results.columns = pd.MultiIndex.from_tuples(list(reductions))
+        else:
+            results.columns = [column for column, _ in reductions]
+        return results
+        
+    def _customer_order_metrics(self) -> pd.DataFrame:
+        """Per-customer order aggregates, grouped once and shared by the analyses"""
+        if self._customer_agg is None:
+            customer_agg = self._orders_groupby_agg('customer_id', {
+                'order_id': 'count',
+                'total_amount': ['sum', 'mean'],
+                'order_date': ['min', 'max']
+            })
+            customer_agg.columns = ['order_frequency', 'total_spent', 'avg_order_value', 'first_order', 'last_order']
+            self._customer_agg = customer_agg
+        return self._customer_agg
+        
+    def _cache_key(self, name: str) -> str:
+        """Identity of the inputs a cached result was computed from"""
+        # Recency is measured in days up to today, so segment results only hold for the day they were made
+        if name in DATE_DEPENDENT_ANALYSES:
+            return f'{self.data_hash}:{date.today().isoformat()}'
+        return self.data_hash
+        
+    def _load_cached_result(self, name: str, cache_key: str) -> Optional[Dict]:
+        """Load a cached analysis result if it was computed from the same inputs"""
+        result_dir = os.path.join(self.cache_dir, name)
+        manifest_path = os.path.join(result_dir, 'manifest.json')
+        if not os.path.exists(manifest_path):
+            return None
+            
+        with open(manifest_path) as f:
+            manifest = json.load(f)
+        if manifest.get('cache_key') != cache_key or 'keys' not in manifest:
+            return None
+            
+        loaded = manifest['values']
+        for key in manifest['frames']:
+            loaded[key] = pd.read_parquet(os.path.join(result_dir, f'{key}.parquet'))
+        for key in manifest['series']:
+            loaded[key] = pd.read_parquet(os.path.join(result_dir, f'{key}.parquet')).iloc[:, 0]
             
+        # Rebuild the result in its original key order, so cached and fresh runs serialize alike
+        return {key: loaded[key] for key in manifest['keys']}
+        
+    def _save_cached_result(self, name: str, results: Dict, cache_key: str) -> None:
+        """Save an analysis result: DataFrames/Series as Parquet, everything else as JSON"""
+        result_dir = os.path.join(self.cache_dir, name)
+        os.makedirs(result_dir, exist_ok=True)
+        
+        manifest = {'cache_key': cache_key, 'keys': list(results), 'frames': [], 'series': [], 'values': {}}
+        for key, value in results.items():
+            if isinstance(value, pd.DataFrame):
+                value.to_parquet(os.path.join(result_dir, f'{key}.parquet'), compression='snappy')
+                manifest['frames'].append(key)
+            elif isinstance(value, pd.Series):
+                value.to_frame().to_parquet(os.path.join(result_dir, f'{key}.parquet'), compression='snappy')
+                manifest['series'].append(key)
+            else:
+                manifest['values'][key] = value
+                
+        # The manifest is written last, so a partially written cache is never loaded
+        with open(os.path.join(result_dir, 'manifest.json'), 'w') as f:
+            json.dump(manifest, f, default=lambda value: value.item())
+            
+    def _run_cached(self, name: str, analysis) -> Dict:
+        """Run an analysis, reusing its cached result when one is available"""
+        if self.cache_dir is None:
+            return analysis()
+            
+        cache_key = self._cache_key(name)
+        results = self._load_cached_result(name, cache_key)
+        if results is None:
+            results = analysis()
+            self._save_cached_result(name, results, cache_key)
+        else:
+            print(f"♻️ Loaded cached {name.replace('_', ' ')} results")
+        return results
+        
     def analyze_customer_segments(self) -> Dict:
         """
         Analyze customer segments based on spending and frequency
@@ -68,47 +337,41 @@ class RestaurantAnalyzer:
         Returns:
             Dictionary containing customer segmentation results
         """
+        self.insights['customer_segments'] = self._customer_segments()
+        return self.insights['customer_segments']
+        
+    def _customer_segments(self) -> Dict:
+        """Customer segmentation results, computed without storing them on the analyzer"""
         print("🔍 Analyzing customer segments...")
         
-        # Calculate customer metrics
-        customer_metrics = self.orders.groupby('customer_id').agg({
-            'order_id': 'count',
-            'total_amount': ['sum', 'mean'],
-            'order_date': ['min', 'max']
-        }).round(2)
+        # Calculate customer metrics (round() returns a copy, leaving the shared aggregate intact)
+        customer_metrics = self._customer_order_metrics().round(2)
         
-        # Flatten column names
-        customer_metrics.columns = ['order_frequency', 'total_spent', 'avg_order_value', 'first_order', 'last_order']
+        # Day differences computed on int64 nanosecond views (floor division matches .dt.days)
+        now_ns = np.datetime64(datetime.now(), 'ns').astype(np.int64)
+        first_ns = customer_metrics['first_order'].to_numpy().astype('datetime64[ns]').view(np.int64)
+        last_ns = customer_metrics['last_order'].to_numpy().astype('datetime64[ns]').view(np.int64)
         
         # Calculate recency (days since last order)
-        customer_metrics['recency'] = (datetime.now() - customer_metrics['last_order']).dt.days
-        
-        # Customer lifetime (days between first and last order)
-        customer_metrics['customer_lifetime'] = (customer_metrics['last_order'] - customer_metrics['first_order']).dt.days
-        customer_metrics['customer_lifetime'] = customer_metrics['customer_lifetime'].fillna(0)
-        
-        # RFM Segmentation (Recency, Frequency, Monetary)
-        customer_metrics['recency_score'] = pd.qcut(customer_metrics['recency'], 5, labels=[5,4,3,2,1])
-        customer_metrics['frequency_score'] = pd.qcut(customer_metrics['order_frequency'].rank(method='first'), 5, labels=[1,2,3,4,5])
-        customer_metrics['monetary_score'] = pd.qcut(customer_metrics['total_spent'], 5, labels=[1,2,3,4,5])
-        
-        # Combine RFM scores - FIXED VERSION
-        customer_metrics['rfm_score'] = (customer_metrics['recency_score'].astype(str) + 
-                                        customer_metrics['frequency_score'].astype(str) + 
-                                        customer_metrics['monetary_score'].astype(str)).astype(int)
-
-        # Create customer segments
-        def categorize_customer(row):
-            if row['total_spent'] >= 500 and row['order_frequency'] >= 10:
-                return 'VIP'
-            elif row['total_spent'] >= 300 and row['order_frequency'] >= 5:
-                return 'High Value'
-            elif row['total_spent'] >= 100 and row['order_frequency'] >= 3:
-                return 'Medium Value'
-            else:
-                return 'Low Value'
-                
-        customer_metrics['segment'] = customer_metrics.apply(categorize_customer, axis=1)
+        customer_metrics['recency'] = ((now_ns - last_ns) // NS_PER_DAY).astype(np.int32)
+        
+        # Customer lifetime (days between first and last order). No fillna needed: a customer
+        # without valid dates has NaT for both ends, whose int64 views cancel to 0.
+        customer_metrics['customer_lifetime'] = ((last_ns - first_ns) // NS_PER_DAY).astype(np.int32)
+        
+        # RFM Segmentation (Recency, Frequency, Monetary) - quintile scores 1-5, combined into
+        # a three-digit RFM score (e.g. 5, 4, 3 -> 543), plus the spending/frequency segment
+        recency_score, frequency_score, monetary_score, rfm_score, segment_codes = _score_customers(
+            customer_metrics['recency'].to_numpy(),
+            customer_metrics['order_frequency'].rank(method='first').to_numpy(),
+            customer_metrics['total_spent'].to_numpy(),
+            customer_metrics['order_frequency'].to_numpy()
+        )
+        customer_metrics['recency_score'] = recency_score
+        customer_metrics['frequency_score'] = frequency_score
+        customer_metrics['monetary_score'] = monetary_score
+        customer_metrics['rfm_score'] = rfm_score
+        customer_metrics['segment'] = pd.Categorical(SEGMENT_LABELS[segment_codes])
         
         # Calculate segment statistics
         segment_stats = customer_metrics.groupby('segment').agg({
@@ -129,24 +392,33 @@ class RestaurantAnalyzer:
             'segments_distribution': customer_metrics['segment'].value_counts()
         }
         
-        self.insights['customer_segments'] = results
         return results
         
     def analyze_menu_performance(self) -> Dict:
         """Analyze menu item performance and popularity"""
+        self.insights['menu_performance'] = self._menu_performance()
+        return self.insights['menu_performance']
+        
+    def _menu_performance(self) -> Dict:
+        """Menu item performance and popularity results, computed without storing them on the analyzer"""
         print("🍽️ Analyzing menu performance...")
         
-        # Merge orders with menu items
-        menu_orders = self.orders.merge(self.menu, on='item_id', how='left')
+        # Merge orders with menu items (price comes along so no second merge is needed)
+        has_price = 'price' in self.menu.columns
+        menu_columns = ['item_id', 'item_name', 'category'] + (['price'] if has_price else [])
+        menu_orders = self.orders.merge(self.menu[menu_columns], on='item_id', how='left')
         
         # Calculate item performance metrics
-        item_performance = menu_orders.groupby(['item_id', 'item_name', 'category']).agg({
+        aggregations = {
             'order_id': 'count',
             'quantity': 'sum',
             'total_amount': 'sum'
-        }).reset_index()
+        }
+        if has_price:
+            aggregations['price'] = 'first'
+        item_performance = menu_orders.groupby(['item_id', 'item_name', 'category'], observed=True).agg(aggregations).reset_index()
         
-        item_performance.columns = ['item_id', 'item_name', 'category', 'order_count', 'total_quantity', 'revenue']
+        item_performance.columns = ['item_id', 'item_name', 'category', 'order_count', 'total_quantity', 'revenue'] + (['price'] if has_price else [])
         
         # Calculate performance percentages
         total_orders = item_performance['order_count'].sum()
@@ -155,12 +427,12 @@ class RestaurantAnalyzer:
         item_performance['order_percentage'] = (item_performance['order_count'] / total_orders * 100).round(2)
         item_performance['revenue_percentage'] = (item_performance['revenue'] / total_revenue * 100).round(2)
         
-        # Add rankings
-        item_performance['popularity_rank'] = item_performance['order_count'].rank(ascending=False, method='min')
-        item_performance['revenue_rank'] = item_performance['revenue'].rank(ascending=False, method='min')
+        # Add rankings (negated values rank descending; ties share the lowest rank)
+        item_performance['popularity_rank'] = rankdata(-item_performance['order_count'].to_numpy(), method='min').astype(np.int32)
+        item_performance['revenue_rank'] = rankdata(-item_performance['revenue'].to_numpy(), method='min').astype(np.int32)
         
         # Category analysis
-        category_performance = item_performance.groupby('category').agg({
+        category_performance = item_performance.groupby('category', observed=True).agg({
             'order_count': 'sum',
             'revenue': 'sum',
             'item_id': 'count'
@@ -175,12 +447,11 @@ class RestaurantAnalyzer:
         bottom_10_popular = item_performance.nsmallest(10, 'order_count')
         
         # Calculate profit margins (assuming cost data)
-        if 'price' in self.menu.columns:
-            item_performance = item_performance.merge(self.menu[['item_id', 'price']], on='item_id')
+        if has_price:
             item_performance['avg_revenue_per_order'] = item_performance['revenue'] / item_performance['order_count']
             
         results = {
-            'item_performance': item_performance.sort_values('order_count', ascending=False),
+            'item_performance': item_performance,  # item_id order; top/bottom lists above are already ranked
             'category_performance': category_performance.sort_values('total_revenue', ascending=False),
             'top_10_popular': top_10_popular,
             'top_10_revenue': top_10_revenue,
@@ -188,43 +459,42 @@ class RestaurantAnalyzer:
             'menu_diversity_score': len(item_performance) / total_orders  # Menu diversity metric
         }
         
-        self.insights['menu_performance'] = results
         return results
         
     def analyze_time_patterns(self) -> Dict:
         """Analyze temporal patterns in orders and customer behavior"""
+        self.insights['time_patterns'] = self._time_patterns()
+        return self.insights['time_patterns']
+        
+    def _time_patterns(self) -> Dict:
+        """Temporal order pattern results, computed without storing them on the analyzer"""
         print("⏰ Analyzing time patterns...")
         
+        # Every time grain uses the same aggregation ('size' counts rows without a null check)
+        time_aggregations = {
+            'order_id': 'size',
+            'total_amount': ['sum', 'mean'],
+            'customer_id': 'nunique'
+        }
+        time_columns = ['order_count', 'total_revenue', 'avg_order_value', 'unique_customers']
+        
         # Hourly patterns
         if 'hour' in self.orders.columns:
-            hourly_patterns = self.orders.groupby('hour').agg({
-                'order_id': 'count',
-                'total_amount': ['sum', 'mean'],
-                'customer_id': 'nunique'
-            }).round(2)
-            hourly_patterns.columns = ['order_count', 'total_revenue', 'avg_order_value', 'unique_customers']
+            hourly_patterns = self._orders_groupby_agg('hour', time_aggregations).round(2)
+            hourly_patterns.columns = time_columns
         else:
             hourly_patterns = None
             
         # Daily patterns
-        daily_patterns = self.orders.groupby('day_name').agg({
-            'order_id': 'count',
-            'total_amount': ['sum', 'mean'],
-            'customer_id': 'nunique'
-        }).round(2)
-        daily_patterns.columns = ['order_count', 'total_revenue', 'avg_order_value', 'unique_customers']
+        daily_patterns = self._orders_groupby_agg('day_name', time_aggregations).round(2)
+        daily_patterns.columns = time_columns
         
-        # Reorder by day of week
-        day_order = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-        daily_patterns = daily_patterns.reindex(day_order)
+        # Reorder by day of week (keeps all seven days even if some have no orders)
+        daily_patterns = daily_patterns.reindex(DAY_ORDER)
         
         # Monthly patterns
-        monthly_patterns = self.orders.groupby(['year', 'month']).agg({
-            'order_id': 'count',
-            'total_amount': ['sum', 'mean'],
-            'customer_id': 'nunique'
-        }).round(2)
-        monthly_patterns.columns = ['order_count', 'total_revenue', 'avg_order_value', 'unique_customers']
+        monthly_patterns = self._orders_groupby_agg(['year', 'month'], time_aggregations).round(2)
+        monthly_patterns.columns = time_columns
         
         # Calculate growth rates
         monthly_patterns['revenue_growth'] = monthly_patterns['total_revenue'].pct_change() * 100
@@ -251,30 +521,36 @@ class RestaurantAnalyzer:
             'peak_day_orders': peak_day_orders
         }
         
-        self.insights['time_patterns'] = results
         return results
         
     def analyze_satisfaction_correlations(self) -> Dict:
         """Analyze correlations between satisfaction and business metrics"""
+        self.insights['satisfaction'] = self._satisfaction()
+        return self.insights['satisfaction']
+        
+    def _satisfaction(self) -> Dict:
+        """Satisfaction correlation results, computed without storing them on the analyzer"""
         print("⭐ Analyzing satisfaction correlations...")
         
         # Customer satisfaction by spending level
-        customer_spending = self.orders.groupby('customer_id')['total_amount'].sum().reset_index()
+        customer_spending = self._customer_order_metrics()['total_spent'].rename('total_amount')
         customer_satisfaction = self.satisfaction.groupby('customer_id').agg({
             'overall_rating': 'mean',
             'food_quality': 'mean',
             'service_quality': 'mean',
             'would_recommend': 'mean'
-        }).reset_index()
-        
-        # Merge spending and satisfaction
-        satisfaction_spending = customer_satisfaction.merge(customer_spending, on='customer_id')
-        
-        # Categorize customers by spending
-        satisfaction_spending['spending_category'] = pd.cut(
-            satisfaction_spending['total_amount'],
-            bins=[0, 50, 150, 300, float('inf')],
-            labels=['Low (<$50)', 'Medium ($50-$150)', 'High ($150-$300)', 'VIP (>$300)']
+        })
+        
+        # Join spending and satisfaction on their sorted customer_id indexes
+        satisfaction_spending = customer_satisfaction.join(customer_spending, how='inner').reset_index()
+        
+        # Categorize customers by spending (right-closed bins (0, 50], (50, 150], (150, 300], (300, inf))
+        amounts = satisfaction_spending['total_amount'].to_numpy()
+        spending_codes = np.where(amounts > 0, np.digitize(amounts, [50, 150, 300], right=True), -1)
+        satisfaction_spending['spending_category'] = pd.Categorical.from_codes(
+            spending_codes,
+            categories=['Low (<$50)', 'Medium ($50-$150)', 'High ($150-$300)', 'VIP (>$300)'],
+            ordered=True
         )
         
         # Satisfaction by spending category
@@ -298,8 +574,8 @@ class RestaurantAnalyzer:
         
         # Satisfaction trends over time
         if 'survey_date' in self.satisfaction.columns:
-            self.satisfaction['survey_month'] = self.satisfaction['survey_date'].dt.to_period('M')
-            satisfaction_trends = self.satisfaction.groupby('survey_month').agg({
+            survey_month = self.satisfaction['survey_date'].dt.to_period('M').rename('survey_month')
+            satisfaction_trends = self.satisfaction.groupby(survey_month).agg({
                 'overall_rating': 'mean',
                 'would_recommend': 'mean'
             }).round(2)
@@ -313,7 +589,6 @@ class RestaurantAnalyzer:
             'correlation_matrix': satisfaction_spending[['overall_rating', 'food_quality', 'service_quality', 'total_amount']].corr()
         }
         
-        self.insights['satisfaction'] = results
         return results
         
     def generate_business_recommendations(self) -> Dict:
@@ -418,11 +693,25 @@ class RestaurantAnalyzer:
         print("🚀 Running comprehensive restaurant analysis...")
         print("=" * 60)
         
-        # Run all analyses
-        customer_analysis = self.analyze_customer_segments()
-        menu_analysis = self.analyze_menu_performance()
-        time_analysis = self.analyze_time_patterns()
-        satisfaction_analysis = self.analyze_satisfaction_correlations()
+        # Run the four independent analyses concurrently (pandas releases the GIL in its C kernels).
+        # The shared per-customer aggregate is built first so the threads don't race to fill it;
+        # the workers only read the analyzer, and their results are stored on this thread.
+        self._customer_order_metrics()
+        analyses = [
+            ('customer_segments', self._customer_segments),
+            ('menu_performance', self._menu_performance),
+            ('time_patterns', self._time_patterns),
+            ('satisfaction', self._satisfaction)
+        ]
+        with ThreadPoolExecutor(max_workers=len(analyses)) as executor:
+            futures = {name: executor.submit(self._run_cached, name, analysis) for name, analysis in analyses}
+            for name, future in futures.items():
+                self.insights[name] = future.result()
+        customer_analysis, menu_analysis, time_analysis, satisfaction_analysis = (
+            self.insights[name] for name, _ in analyses
+        )
+            
+        # Recommendations read the stored insights, so they run once all analyses finish
         recommendations = self.generate_business_recommendations()
         
         # Compile comprehensive report
@@ -451,25 +740,46 @@ class RestaurantAnalyzer:
         return comprehensive_insights
         
 # Utility functions for external use
+def _read_csv(path: str, dtypes: Dict[str, str], date_columns: Optional[List[str]] = None) -> pd.DataFrame:
+    """Read a CSV with a typed schema, parsing date columns during the read"""
+    return pd.read_csv(path, dtype=dtypes, parse_dates=date_columns or False)
+
 def load_data(data_path: str = 'data/') -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame, pd.DataFrame]:
     """Load restaurant data from files"""
-    orders = pd.read_csv(f'{data_path}processed/cleaned_orders.csv')
-    visits = pd.read_csv(f'{data_path}processed/cleaned_visits.csv')
-    satisfaction = pd.read_csv(f'{data_path}processed/cleaned_satisfaction.csv')
-    menu = pd.read_csv(f'{data_path}raw/menu_items.csv')
+    # The files are independent and the C parser releases the GIL, so parse them concurrently
+    with ThreadPoolExecutor(max_workers=len(INPUT_FILES)) as executor:
+        futures = [executor.submit(_read_csv, f'{data_path}{path}', dtypes, date_columns)
+                   for path, dtypes, date_columns in INPUT_FILES]
+        orders, visits, satisfaction, menu = (future.result() for future in futures)
     
     return orders, visits, satisfaction, menu
 
-def create_analyzer(data_path: str = 'data/') -> RestaurantAnalyzer:
+def input_files_hash(data_path: str = 'data/') -> str:
+    """
+    Digest of the analysis input files' contents
+    
+    The processor rewrites its outputs on every run, so modification times can't tell
+    whether cached results are still valid; unchanged contents hash the same.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for path, _, _ in INPUT_FILES:
+        digest.update(path.encode('utf-8'))
+        with open(f'{data_path}{path}', 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                digest.update(block)
+    return digest.hexdigest()
+
+def create_analyzer(data_path: str = 'data/', cache_dir: Optional[str] = None) -> RestaurantAnalyzer:
     """Create and return a RestaurantAnalyzer instance"""
     orders, visits, satisfaction, menu = load_data(data_path)
-    return RestaurantAnalyzer(orders, visits, satisfaction, menu)
+    data_hash = input_files_hash(data_path) if cache_dir is not None else None
+    return RestaurantAnalyzer(orders, visits, satisfaction, menu, cache_dir=cache_dir, data_hash=data_hash)
 
 # Example usage
 if __name__ == "__main__":
     # Example of how to use the analyzer
     try:
-        analyzer = create_analyzer()
+        analyzer = create_analyzer(cache_dir='data/processed/analysis_cache')
         insights = analyzer.run_comprehensive_analysis()
         
         print("\n🎯 KEY FINDINGS:")
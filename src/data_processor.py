@@ -11,24 +11,151 @@ Handles data cleaning, transformation, and preliminary analysis.
 import pandas as pd
 import numpy as np
 import sqlite3
+import csv
+import io
 import warnings
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 import os
 import logging
 
+# PyArrow gives multithreaded CSV parsing/writing and Parquet output; pandas is the fallback
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:
+    pa = None
+
+try:
+    import polars as pl
+except ImportError:
+    pl = None
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
 warnings.filterwarnings('ignore')
 
+DATE_FORMAT = '%Y-%m-%d'
+SPEND_THRESHOLDS = np.array([100, 300, 500])
+SPEND_SEGMENTS = ['Low Value', 'Medium Value', 'High Value', 'VIP']
+DAY_ORDER = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+
+def format_clock_times(hours, minutes):
+    """Format hour and minute arrays as zero-padded HH:MM strings"""
+    return np.char.add(np.char.add(np.char.zfill(hours.astype(str), 2), ':'),
+                       np.char.zfill(minutes.astype(str), 2))
+
+def parse_dates(values):
+    """Parse YYYY-MM-DD strings, passing through columns that are already datetime64"""
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return values
+    return pd.to_datetime(values, format=DATE_FORMAT, cache=True)
+
+def valid_order_mask(quantity, total_amount):
+    """Boolean mask of orders with a positive quantity and amount"""
+    return (quantity > 0) & (total_amount > 0)
+
+def descending_min_rank(values):
+    """Rank values from largest (1) down, giving tied values the same best rank"""
+    negated = -np.asarray(values, dtype=np.float64)
+    return np.searchsorted(np.sort(negated), negated, side='left') + 1
+
+def _analysis_input(name):
+    """Table attribute whose reassignment drops every memoized analysis"""
+    private_name = '_' + name
+    
+    def get_table(self):
+        return getattr(self, private_name)
+        
+    def set_table(self, df):
+        setattr(self, private_name, df)
+        self._cache.clear()
+        
+    return property(get_table, set_table)
+
 class ZOQDataProcessor:
     """Main class for processing ZOQ restaurant data"""
     
-    def __init__(self, data_path='data/'):
+    # DataFrame attribute -> raw file name (without extension)
+    RAW_FILES = {
+        'orders_df': 'customer_orders_2023',
+        'visits_df': 'customer_visits_2023',
+        'satisfaction_df': 'customer_satisfaction_2023',
+        'menu_df': 'menu_items'
+    }
+    
+    # Compact column types for the raw tables; HH:MM columns stay strings
+    # (PyArrow would otherwise infer time32). Ids and the columns clean_data
+    # filters on are signed and wide enough to load bad rows so they can be dropped.
+    RAW_DTYPES = {
+        'orders_df': {
+            'order_id': 'int32', 'customer_id': 'int32', 'order_time': 'str',
+            'item_id': 'int32', 'quantity': 'int16', 'total_amount': 'float64'
+        },
+        'visits_df': {
+            'visit_id': 'int32', 'customer_id': 'int32', 'visit_time': 'str',
+            'party_size': 'int16', 'duration_minutes': 'int32'
+        },
+        'satisfaction_df': {
+            'survey_id': 'int32', 'customer_id': 'int32', 'overall_rating': 'int8',
+            'food_quality': 'int8', 'service_quality': 'int8', 'atmosphere': 'int8',
+            'would_recommend': 'int8'
+        },
+        'menu_df': {
+            'item_id': 'int32', 'item_name': 'str', 'category': 'str', 'price': 'float64'
+        }
+    }
+    
+    # Aggregations for backend='sqlite' (orders and visits are grouped before joining)
+    CUSTOMER_METRICS_SQL = """
+        SELECT o.customer_id, o.total_orders, o.total_spent, o.avg_order_value,
+               COALESCE(v.visit_frequency, 0) AS visit_frequency
+        FROM (
+            SELECT customer_id, COUNT(order_id) AS total_orders,
+                   SUM(total_amount) AS total_spent, AVG(total_amount) AS avg_order_value
+            FROM orders GROUP BY customer_id
+        ) AS o
+        LEFT JOIN (
+            SELECT customer_id, COUNT(DISTINCT visit_date) AS visit_frequency
+            FROM visits GROUP BY customer_id
+        ) AS v USING (customer_id)
+        ORDER BY o.customer_id
+    """
+    MENU_METRICS_SQL = """
+        SELECT m.item_id, m.item_name, m.category, COUNT(*) AS order_count,
+               SUM(o.quantity) AS total_quantity, SUM(o.total_amount) AS revenue
+        FROM orders AS o JOIN menu AS m USING (item_id)
+        GROUP BY m.item_id, m.item_name, m.category
+    """
+    
+    # Inputs of the memoized customer/menu metrics; assigning a new frame invalidates them
+    orders_df = _analysis_input('orders_df')
+    visits_df = _analysis_input('visits_df')
+    menu_df = _analysis_input('menu_df')
+    
+    # Columns the customer/menu metrics read from each input table
+    METRIC_COLUMNS = {
+        'orders_df': ['order_id', 'customer_id', 'item_id', 'quantity', 'total_amount'],
+        'visits_df': ['customer_id', 'visit_date'],
+        'menu_df': ['item_id', 'item_name', 'category']
+    }
+    
+    # Engines for the customer/menu aggregations (see analyze_customer_behavior)
+    BACKENDS = ('pandas', 'polars', 'sqlite')
+    
+    def __init__(self, data_path='data/', backend='pandas'):
+        if backend not in self.BACKENDS:
+            raise ValueError(f"Unknown backend {backend!r}; expected one of {', '.join(self.BACKENDS)}")
+        if backend == 'polars' and pl is None:
+            logger.warning("Polars is not installed; falling back to the pandas backend")
+            backend = 'pandas'
+        self.backend = backend
         self.data_path = data_path
         self.raw_data_path = os.path.join(data_path, 'raw/')
         self.processed_data_path = os.path.join(data_path, 'processed/')
+        self._cache = {}
         self.create_directories()
         
     def create_directories(self):
@@ -41,11 +168,14 @@ class ZOQDataProcessor:
         logger.info("Loading raw data files...")
         
         try:
-            # Load main datasets
-            self.orders_df = pd.read_csv(os.path.join(self.raw_data_path, 'customer_orders_2023.csv'))
-            self.visits_df = pd.read_csv(os.path.join(self.raw_data_path, 'customer_visits_2023.csv'))
-            self.satisfaction_df = pd.read_csv(os.path.join(self.raw_data_path, 'customer_satisfaction_2023.csv'))
-            self.menu_df = pd.read_csv(os.path.join(self.raw_data_path, 'menu_items.csv'))
+            # Load main datasets (the files are independent, so they are read concurrently)
+            with ThreadPoolExecutor(max_workers=len(self.RAW_FILES)) as executor:
+                futures = {
+                    attr: executor.submit(self.read_table, os.path.join(self.raw_data_path, name), self.RAW_DTYPES[attr])
+                    for attr, name in self.RAW_FILES.items()
+                }
+                for attr, future in futures.items():
+                    setattr(self, attr, future.result())
             
             logger.info(f"Loaded {len(self.orders_df)} order records")
             logger.info(f"Loaded {len(self.visits_df)} visit records")
@@ -59,6 +189,66 @@ class ZOQDataProcessor:
             self.generate_sample_data()
             return False
             
+    def read_table(self, path_base, dtypes=None):
+        """Read a table, preferring a Parquet copy over the CSV when one exists"""
+        if pa is not None and os.path.exists(path_base + '.parquet'):
+            return pd.read_parquet(path_base + '.parquet')
+        
+        csv_path = path_base + '.csv'
+        dtypes = dtypes or {}
+        if pa is None:
+            # Nullable integers, so a missing value loads as NA for clean_data to drop
+            # (PyArrow reads such a column as float instead)
+            return pd.read_csv(csv_path, dtype={
+                column: dtype.capitalize() if dtype.startswith('int') else dtype
+                for column, dtype in dtypes.items()
+            })
+        
+        convert_options = pacsv.ConvertOptions(column_types={
+            column: pa.string() if dtype == 'str' else pa.from_numpy_dtype(np.dtype(dtype))
+            for column, dtype in dtypes.items()
+        })
+        table = pacsv.read_csv(csv_path, convert_options=convert_options)
+        return table.to_pandas(date_as_object=False)
+        
+    def write_table(self, df, path_base, file_format='csv', index=False):
+        """Write a table as CSV (through PyArrow's writer when installed) or snappy-compressed Parquet"""
+        if file_format == 'parquet':
+            df.to_parquet(path_base + '.parquet', compression='snappy', index=index)
+            return
+            
+        if pa is not None:
+            table = pa.Table.from_pandas(df.reset_index() if index else df, preserve_index=False)
+            
+            # Datetime columns only hold calendar dates, so write them as YYYY-MM-DD
+            table = table.cast(pa.schema([
+                pa.field(field.name, pa.date32()) if pa.types.is_timestamp(field.type) else field
+                for field in table.schema
+            ]))
+            try:
+                self._write_arrow_csv(table, path_base + '.csv')
+                return
+            except pa.ArrowInvalid:
+                # Some value holds a delimiter, quote or newline; let pandas quote it
+                pass
+                
+        df.to_csv(path_base + '.csv', index=index)
+        
+    @staticmethod
+    def _write_arrow_csv(table, path):
+        """
+        Write a table with PyArrow in DataFrame.to_csv's layout (minimal quoting)
+        
+        PyArrow always quotes the header and every string field, so the header is
+        written separately and the rows go out unquoted. Raises ArrowInvalid when a
+        value would need quoting.
+        """
+        header = io.StringIO()
+        csv.writer(header, lineterminator='\n').writerow(table.column_names)
+        with open(path, 'wb') as f:
+            f.write(header.getvalue().encode('utf-8'))
+            pacsv.write_csv(table, f, write_options=pacsv.WriteOptions(include_header=False, quoting_style='none'))
+            
     def generate_sample_data(self):
         """Generate sample data for demonstration purposes"""
         logger.info("Generating sample data for demonstration...")
@@ -80,203 +270,290 @@ class ZOQDataProcessor:
             ('House Wine', 'Beverage', 12.99)
         ]
         
-        self.menu_df = pd.DataFrame(menu_items, columns=['item_name', 'category', 'price'])
-        self.menu_df['item_id'] = range(1, len(self.menu_df) + 1)
+        item_names, categories, prices = zip(*menu_items)
+        self.menu_df = pd.DataFrame({
+            'item_name': item_names,
+            'category': categories,
+            'price': np.array(prices),
+            'item_id': np.arange(1, len(menu_items) + 1)
+        })
         
         # Generate customer orders (3200+ records)
         n_orders = 3200
         start_date = datetime(2023, 1, 1)
         end_date = datetime(2023, 12, 31)
         
-        orders_data = []
-        for i in range(n_orders):
-            order_date = start_date + timedelta(days=np.random.randint(0, 365))
-            customer_id = np.random.randint(1, 800)  # 800 unique customers
-            item_id = np.random.choice(self.menu_df['item_id'].values)
-            quantity = np.random.choice([1, 2, 3], p=[0.7, 0.25, 0.05])
-            
-            item_price = self.menu_df[self.menu_df['item_id'] == item_id]['price'].iloc[0]
-            total_amount = item_price * quantity
-            
-            orders_data.append({
-                'order_id': i + 1,
-                'customer_id': customer_id,
-                'order_date': order_date.strftime('%Y-%m-%d'),
-                'order_time': f"{np.random.randint(11, 22):02d}:{np.random.randint(0, 60):02d}",
-                'item_id': item_id,
-                'quantity': quantity,
-                'total_amount': round(total_amount, 2)
-            })
-            
-        self.orders_df = pd.DataFrame(orders_data)
+        order_dates = start_date + pd.to_timedelta(np.random.randint(0, 365, n_orders), unit='D')
+        item_ids = np.random.choice(self.menu_df['item_id'].values, n_orders)
+        quantities = np.random.choice([1, 2, 3], n_orders, p=[0.7, 0.25, 0.05])
+        
+        # item_id is the 1-based menu row, so prices come straight from the price array
+        price_by_id = self.menu_df['price'].to_numpy()
+        item_prices = price_by_id[item_ids - 1]
+        
+        self.orders_df = pd.DataFrame({
+            'order_id': np.arange(1, n_orders + 1),
+            'customer_id': np.random.randint(1, 800, n_orders),  # 800 unique customers
+            'order_date': order_dates,
+            'order_time': format_clock_times(np.random.randint(11, 22, n_orders),
+                                             np.random.randint(0, 60, n_orders)),
+            'item_id': item_ids,
+            'quantity': quantities,
+            'total_amount': np.round(item_prices * quantities, 2)
+        })
         
         # Generate customer visits (2800+ records)
         n_visits = 2800
-        visits_data = []
-        
-        for i in range(n_visits):
-            visit_date = start_date + timedelta(days=np.random.randint(0, 365))
-            customer_id = np.random.randint(1, 800)
-            party_size = np.random.choice([1, 2, 3, 4, 5, 6], p=[0.15, 0.35, 0.25, 0.15, 0.07, 0.03])
-            
-            # Duration based on meal type (lunch vs dinner)
-            hour = np.random.randint(11, 22)
-            if hour < 15:  # Lunch
-                duration = np.random.normal(45, 15)
-            else:  # Dinner
-                duration = np.random.normal(72, 20)
-            
-            duration = max(30, int(duration))  # Minimum 30 minutes
-            
-            visits_data.append({
-                'visit_id': i + 1,
-                'customer_id': customer_id,
-                'visit_date': visit_date.strftime('%Y-%m-%d'),
-                'visit_time': f"{hour:02d}:{np.random.randint(0, 60):02d}",
-                'party_size': party_size,
-                'duration_minutes': duration
-            })
-            
-        self.visits_df = pd.DataFrame(visits_data)
+        visit_dates = start_date + pd.to_timedelta(np.random.randint(0, 365, n_visits), unit='D')
+        visit_hours = np.random.randint(11, 22, n_visits)
+        
+        # Duration based on meal type (lunch vs dinner)
+        durations = np.where(visit_hours < 15,
+                             np.random.normal(45, 15, n_visits),   # Lunch
+                             np.random.normal(72, 20, n_visits))   # Dinner
+        
+        self.visits_df = pd.DataFrame({
+            'visit_id': np.arange(1, n_visits + 1),
+            'customer_id': np.random.randint(1, 800, n_visits),
+            'visit_date': visit_dates,
+            'visit_time': format_clock_times(visit_hours, np.random.randint(0, 60, n_visits)),
+            'party_size': np.random.choice([1, 2, 3, 4, 5, 6], n_visits,
+                                           p=[0.15, 0.35, 0.25, 0.15, 0.07, 0.03]),
+            'duration_minutes': np.maximum(30, durations.astype(int))  # Minimum 30 minutes
+        })
         
         # Generate satisfaction surveys (2500+ records)
         n_surveys = 2500
-        satisfaction_data = []
-        
-        for i in range(n_surveys):
-            customer_id = np.random.randint(1, 800)
-            survey_date = start_date + timedelta(days=np.random.randint(0, 365))
-            
-            # Generate ratings (1-5 scale, weighted toward positive)
-            overall_rating = np.random.choice([1, 2, 3, 4, 5], p=[0.05, 0.1, 0.25, 0.35, 0.25])
-            food_quality = np.random.choice([1, 2, 3, 4, 5], p=[0.03, 0.07, 0.2, 0.4, 0.3])
-            service_quality = np.random.choice([1, 2, 3, 4, 5], p=[0.04, 0.08, 0.23, 0.38, 0.27])
-            atmosphere = np.random.choice([1, 2, 3, 4, 5], p=[0.02, 0.06, 0.22, 0.42, 0.28])
-            
-            satisfaction_data.append({
-                'survey_id': i + 1,
-                'customer_id': customer_id,
-                'survey_date': survey_date.strftime('%Y-%m-%d'),
-                'overall_rating': overall_rating,
-                'food_quality': food_quality,
-                'service_quality': service_quality,
-                'atmosphere': atmosphere,
-                'would_recommend': 1 if overall_rating >= 4 else 0
-            })
-            
-        self.satisfaction_df = pd.DataFrame(satisfaction_data)
+        survey_dates = start_date + pd.to_timedelta(np.random.randint(0, 365, n_surveys), unit='D')
+        
+        # Generate ratings (1-5 scale, weighted toward positive) for all four questions
+        # from one uniform draw, inverted through each question's cumulative distribution
+        rating_columns = ['overall_rating', 'food_quality', 'service_quality', 'atmosphere']
+        rating_probabilities = np.array([
+            [0.05, 0.1, 0.25, 0.35, 0.25],
+            [0.03, 0.07, 0.2, 0.4, 0.3],
+            [0.04, 0.08, 0.23, 0.38, 0.27],
+            [0.02, 0.06, 0.22, 0.42, 0.28]
+        ])
+        rating_thresholds = rating_probabilities.cumsum(axis=1)[:, :-1]
+        draws = np.random.random((n_surveys, len(rating_columns)))
+        ratings = (draws[:, :, None] >= rating_thresholds).sum(axis=2).astype(np.int8) + 1
+        
+        self.satisfaction_df = pd.DataFrame({
+            'survey_id': np.arange(1, n_surveys + 1),
+            'customer_id': np.random.randint(1, 800, n_surveys),
+            'survey_date': survey_dates
+        })
+        self.satisfaction_df[rating_columns] = ratings
+        self.satisfaction_df['would_recommend'] = (ratings[:, 0] >= 4).astype(np.int8)
         
         # Save sample data
         self.save_raw_data()
         logger.info("Sample data generated successfully")
         
-    def save_raw_data(self):
-        """Save raw data to CSV files"""
-        self.orders_df.to_csv(os.path.join(self.raw_data_path, 'customer_orders_2023.csv'), index=False)
-        self.visits_df.to_csv(os.path.join(self.raw_data_path, 'customer_visits_2023.csv'), index=False)
-        self.satisfaction_df.to_csv(os.path.join(self.raw_data_path, 'customer_satisfaction_2023.csv'), index=False)
-        self.menu_df.to_csv(os.path.join(self.raw_data_path, 'menu_items.csv'), index=False)
+    def save_raw_data(self, file_format='csv'):
+        """Save raw data to CSV (or Parquet) files"""
+        for attr, name in self.RAW_FILES.items():
+            self.write_table(getattr(self, attr), os.path.join(self.raw_data_path, name), file_format)
         
     def clean_data(self):
-        """Clean and validate data"""
+        """Clean and validate data (each table is filtered with one combined mask)"""
         logger.info("Cleaning data...")
         
         # Clean orders data
-        self.orders_df['order_date'] = pd.to_datetime(self.orders_df['order_date'])
-        self.orders_df = self.orders_df.dropna()
-        self.orders_df = self.orders_df[self.orders_df['quantity'] > 0]
-        self.orders_df = self.orders_df[self.orders_df['total_amount'] > 0]
+        self.orders_df['order_date'] = parse_dates(self.orders_df['order_date'])
+        orders_mask = self.orders_df.notna().all(axis=1).to_numpy() & valid_order_mask(
+            self.orders_df['quantity'].to_numpy(), self.orders_df['total_amount'].to_numpy()
+        )
+        self.orders_df = self.orders_df[orders_mask]
         
         # Clean visits data
-        self.visits_df['visit_date'] = pd.to_datetime(self.visits_df['visit_date'])
-        self.visits_df = self.visits_df.dropna()
-        self.visits_df = self.visits_df[self.visits_df['duration_minutes'] > 0]
+        self.visits_df['visit_date'] = parse_dates(self.visits_df['visit_date'])
+        visits_mask = self.visits_df.notna().all(axis=1) & (self.visits_df['duration_minutes'] > 0)
+        self.visits_df = self.visits_df[visits_mask]
         
         # Clean satisfaction data
-        self.satisfaction_df['survey_date'] = pd.to_datetime(self.satisfaction_df['survey_date'])
+        self.satisfaction_df['survey_date'] = parse_dates(self.satisfaction_df['survey_date'])
         self.satisfaction_df = self.satisfaction_df.dropna()
         
         logger.info("Data cleaning completed")
         
     def analyze_customer_behavior(self):
-        """Analyze customer behavior patterns"""
+        """Analyze customer behavior patterns (computed once per cleaned dataset)"""
+        fingerprint = self._data_fingerprint()
+        cached = self._cache.get('customer_metrics')
+        if cached is not None and cached[0] == fingerprint:
+            return cached[1]
+            
         logger.info("Analyzing customer behavior...")
         
-        # Merge orders with visits for comprehensive analysis
-        customer_data = self.orders_df.merge(
-            self.visits_df[['customer_id', 'visit_date', 'party_size', 'duration_minutes']], 
-            on='customer_id', 
-            how='left'
+        if self.backend != 'pandas':
+            self._collect_backend_metrics(fingerprint)
+            return self._cache['customer_metrics'][1]
+        
+        # Aggregate orders and visits separately; merging them first would repeat
+        # every order once per visit and inflate the spending totals
+        order_metrics = self.orders_df.groupby('customer_id').agg(
+            total_orders=('order_id', 'count'),
+            total_spent=('total_amount', 'sum'),
+            avg_order_value=('total_amount', 'mean')
         )
+        visit_frequency = self.visits_df.groupby('customer_id')['visit_date'].nunique().rename('visit_frequency')
         
         # Customer segmentation
-        customer_metrics = customer_data.groupby('customer_id').agg({
-            'order_id': 'count',
-            'total_amount': ['sum', 'mean'],
-            'visit_date': 'nunique'
-        }).round(2)
-        
-        customer_metrics.columns = ['total_orders', 'total_spent', 'avg_order_value', 'visit_frequency']
-        
-        # Categorize customers
-        customer_metrics['customer_segment'] = pd.cut(
-            customer_metrics['total_spent'], 
-            bins=[0, 100, 300, 500, float('inf')], 
-            labels=['Low Value', 'Medium Value', 'High Value', 'VIP']
+        customer_metrics = order_metrics.join(visit_frequency, how='left')
+        customer_metrics = self._segment_customers(customer_metrics)
+        self._cache['customer_metrics'] = (fingerprint, customer_metrics)
+        return customer_metrics
+        
+    def _data_fingerprint(self):
+        """
+        Row counts and content hashes of the columns the metrics read
+        
+        Reassigning an input table already clears the cache; the hashes also catch
+        in-place edits such as df.loc[mask, 'total_amount'] *= 2.
+        """
+        return tuple(
+            (len(df), int(pd.util.hash_pandas_object(df[columns], index=False).sum()))
+            for df, columns in ((getattr(self, attr), columns) for attr, columns in self.METRIC_COLUMNS.items())
+        )
+        
+    def _segment_customers(self, customer_metrics):
+        """Round customer metrics and assign spend-based segments"""
+        customer_metrics = customer_metrics.round(2)
+        customer_metrics['visit_frequency'] = customer_metrics['visit_frequency'].fillna(0).astype(int)
+        
+        # Categorize customers: spend bins are right-closed, (0, 100], (100, 300], ...
+        total_spent = customer_metrics['total_spent'].to_numpy()
+        segment_codes = np.searchsorted(SPEND_THRESHOLDS, total_spent, side='left')
+        segment_codes[total_spent <= 0] = -1
+        customer_metrics['customer_segment'] = pd.Categorical.from_codes(
+            segment_codes, categories=SPEND_SEGMENTS, ordered=True
         )
         
         return customer_metrics
         
     def analyze_menu_performance(self):
-        """Analyze menu item performance"""
+        """Analyze menu item performance (computed once per cleaned dataset)"""
+        fingerprint = self._data_fingerprint()
+        cached = self._cache.get('menu_metrics')
+        if cached is not None and cached[0] == fingerprint:
+            return cached[1]
+            
         logger.info("Analyzing menu performance...")
         
-        # Merge orders with menu items
-        menu_performance = self.orders_df.merge(self.menu_df, on='item_id')
+        if self.backend != 'pandas':
+            self._collect_backend_metrics(fingerprint)
+            return self._cache['menu_metrics'][1]
         
-        # Calculate performance metrics
-        item_metrics = menu_performance.groupby(['item_id', 'item_name', 'category']).agg({
-            'order_id': 'count',
-            'quantity': 'sum',
-            'total_amount': 'sum'
-        }).reset_index()
-        
-        item_metrics.columns = ['item_id', 'item_name', 'category', 'order_count', 'total_quantity', 'revenue']
+        # Merge orders with menu items (names and categories as categoricals so they group on codes)
+        menu_items = self.menu_df.astype({'item_name': 'category', 'category': 'category'})
+        menu_performance = self.orders_df.merge(menu_items, on='item_id')
         
+        # Calculate performance metrics
+        # order_id is never null, so group sizes give the order counts; rows are sorted by count below
+        item_metrics = menu_performance.groupby(['item_id', 'item_name', 'category'], observed=True, sort=False).agg(
+            order_count=('order_id', 'size'),
+            total_quantity=('quantity', 'sum'),
+            revenue=('total_amount', 'sum')
+        ).reset_index()
+        
+        item_metrics = self._rank_menu_items(item_metrics)
+        self._cache['menu_metrics'] = (fingerprint, item_metrics)
+        return item_metrics
+        
+    def _rank_menu_items(self, item_metrics):
+        """Add order shares and popularity/revenue ranks, most ordered items first"""
         # Calculate percentages
-        total_orders = item_metrics['order_count'].sum()
-        item_metrics['order_percentage'] = (item_metrics['order_count'] / total_orders * 100).round(2)
+        order_counts = item_metrics['order_count'].to_numpy()
+        item_metrics['order_percentage'] = np.round(order_counts * (100.0 / order_counts.sum()), 2)
+        
+        # Rank items (ties share the best rank, like rank(method='min'))
+        item_metrics['popularity_rank'] = descending_min_rank(order_counts)
+        item_metrics['revenue_rank'] = descending_min_rank(item_metrics['revenue'].to_numpy())
+        
+        return item_metrics.sort_values(['order_count', 'item_id'], ascending=[False, True])
+        
+    def _collect_backend_metrics(self, fingerprint):
+        """Compute customer and menu metrics together on the configured non-pandas backend"""
+        if self.backend == 'sqlite':
+            customer_metrics, item_metrics = self._collect_sql_metrics()
+        elif self.backend == 'polars':
+            customer_metrics, item_metrics = self._collect_polars_metrics()
+        else:
+            raise ValueError(f"No combined metrics query for backend {self.backend!r}")
+            
+        self._cache['customer_metrics'] = (fingerprint, self._segment_customers(customer_metrics))
+        item_metrics = item_metrics.astype({'item_name': 'category', 'category': 'category'})
+        self._cache['menu_metrics'] = (fingerprint, self._rank_menu_items(item_metrics))
+            
+    def _collect_sql_metrics(self):
+        """Compute customer and menu metrics with GROUP BY queries on an in-memory SQLite copy"""
+        with sqlite3.connect(':memory:') as conn:
+            self.orders_df[['order_id', 'customer_id', 'item_id', 'quantity', 'total_amount']].to_sql(
+                'orders', conn, index=False
+            )
+            self.visits_df[['customer_id', 'visit_date']].to_sql('visits', conn, index=False)
+            self.menu_df[['item_id', 'item_name', 'category']].to_sql('menu', conn, index=False)
+            
+            customer_metrics = pd.read_sql_query(self.CUSTOMER_METRICS_SQL, conn, index_col='customer_id')
+            item_metrics = pd.read_sql_query(self.MENU_METRICS_SQL, conn)
+            
+        return customer_metrics, item_metrics
+        
+    def _collect_polars_metrics(self):
+        """Compute customer and menu metrics as one Polars lazy query plan"""
+        orders = pl.from_pandas(
+            self.orders_df[['order_id', 'customer_id', 'item_id', 'quantity', 'total_amount']]
+        ).lazy()
+        visits = pl.from_pandas(self.visits_df[['customer_id', 'visit_date']]).lazy()
+        menu = pl.from_pandas(self.menu_df[['item_id', 'item_name', 'category']]).lazy()
+        
+        customer_query = orders.group_by('customer_id').agg(
+            pl.col('order_id').count().alias('total_orders'),
+            pl.col('total_amount').sum().alias('total_spent'),
+            pl.col('total_amount').mean().alias('avg_order_value')
+        ).join(
+            visits.group_by('customer_id').agg(pl.col('visit_date').n_unique().alias('visit_frequency')),
+            on='customer_id',
+            how='left'
+        ).sort('customer_id')
+        
+        menu_query = orders.join(menu, on='item_id').group_by(['item_id', 'item_name', 'category']).agg(
+            pl.len().alias('order_count'),
+            pl.col('quantity').sum().alias('total_quantity'),
+            pl.col('total_amount').sum().alias('revenue')
+        )
         
-        # Rank items
-        item_metrics['popularity_rank'] = item_metrics['order_count'].rank(ascending=False, method='min')
-        item_metrics['revenue_rank'] = item_metrics['revenue'].rank(ascending=False, method='min')
+        customer_result, menu_result = pl.collect_all([customer_query, menu_query])
         
-        return item_metrics.sort_values('order_count', ascending=False)
+        return customer_result.to_pandas().set_index('customer_id'), menu_result.to_pandas()
         
     def analyze_time_patterns(self):
         """Analyze temporal patterns in orders and visits"""
         logger.info("Analyzing time patterns...")
         
-        # Extract time features
-        self.orders_df['hour'] = pd.to_datetime(self.orders_df['order_time'], format='%H:%M').dt.hour
-        self.orders_df['month'] = self.orders_df['order_date'].dt.month
-        self.orders_df['day_of_week'] = self.orders_df['order_date'].dt.dayofweek
-        self.orders_df['day_name'] = self.orders_df['order_date'].dt.day_name()
+        # Extract time features (order_time is zero-padded HH:MM, so the hour is the first two characters)
+        self.orders_df['hour'] = self.orders_df['order_time'].str[:2].astype('int8')
+        self.orders_df['month'] = self.orders_df['order_date'].dt.month.astype('int8')
+        self.orders_df['day_of_week'] = self.orders_df['order_date'].dt.dayofweek.astype('int8')
+        self.orders_df['day_name'] = pd.Categorical.from_codes(self.orders_df['day_of_week'], categories=DAY_ORDER)
         
         # Peak hours analysis
         hourly_orders = self.orders_df.groupby('hour').size().reset_index(name='order_count')
         
         # Monthly trends
-        monthly_orders = self.orders_df.groupby('month').agg({
-            'order_id': 'count',
-            'total_amount': 'sum'
-        }).reset_index()
+        order_months = self.orders_df['order_date'].dt.to_period('M').rename('month')
+        monthly_orders = self.orders_df.groupby(order_months).agg(
+            order_id=('order_id', 'size'),
+            total_amount=('total_amount', 'sum')
+        ).reset_index()
         
         # Day of week patterns
-        weekly_orders = self.orders_df.groupby('day_name').agg({
-            'order_id': 'count',
-            'total_amount': 'sum'
-        }).reset_index()
+        weekly_orders = self.orders_df.groupby('day_name', observed=True).agg(
+            order_id=('order_id', 'size'),
+            total_amount=('total_amount', 'sum')
+        ).reset_index()
         
         return {
             'hourly': hourly_orders,
@@ -302,6 +579,7 @@ class ZOQDataProcessor:
         
         # Time pattern insights
         time_patterns = self.analyze_time_patterns()
+        hourly = time_patterns['hourly']
         
         # Satisfaction insights
         avg_satisfaction = self.satisfaction_df['overall_rating'].mean()
@@ -317,28 +595,28 @@ class ZOQDataProcessor:
                 'recommendation_rate': round(recommendation_rate * 100, 1)
             },
             'top_dishes': menu_metrics.head(10),
-            'peak_hour': time_patterns['hourly'].loc[time_patterns['hourly']['order_count'].idxmax(), 'hour'],
+            'peak_hour': int(hourly['hour'].iloc[hourly['order_count'].to_numpy().argmax()]),
             'customer_segments': customer_metrics['customer_segment'].value_counts(),
             'monthly_trends': time_patterns['monthly']
         }
         
         return insights
         
-    def save_processed_data(self):
-        """Save processed data and insights"""
+    def save_processed_data(self, file_format='csv'):
+        """Save processed data and insights (as CSV or Parquet)"""
         logger.info("Saving processed data...")
         
         # Save cleaned datasets
-        self.orders_df.to_csv(os.path.join(self.processed_data_path, 'cleaned_orders.csv'), index=False)
-        self.visits_df.to_csv(os.path.join(self.processed_data_path, 'cleaned_visits.csv'), index=False)
-        self.satisfaction_df.to_csv(os.path.join(self.processed_data_path, 'cleaned_satisfaction.csv'), index=False)
+        self.write_table(self.orders_df, os.path.join(self.processed_data_path, 'cleaned_orders'), file_format)
+        self.write_table(self.visits_df, os.path.join(self.processed_data_path, 'cleaned_visits'), file_format)
+        self.write_table(self.satisfaction_df, os.path.join(self.processed_data_path, 'cleaned_satisfaction'), file_format)
         
         # Save analysis results
         customer_metrics = self.analyze_customer_behavior()
         menu_metrics = self.analyze_menu_performance()
         
-        customer_metrics.to_csv(os.path.join(self.processed_data_path, 'customer_analysis.csv'))
-        menu_metrics.to_csv(os.path.join(self.processed_data_path, 'menu_analysis.csv'), index=False)
+        self.write_table(customer_metrics, os.path.join(self.processed_data_path, 'customer_analysis'), file_format, index=True)
+        self.write_table(menu_metrics, os.path.join(self.processed_data_path, 'menu_analysis'), file_format)
         
         logger.info("Processed data saved successfully")
         
@@ -7,71 +7,141 @@ This module generates comprehensive business reports from restaurant data analys
 Creates executive summaries, detailed findings, and actionable recommendations.
 """
 
-import pandas as pd
-import numpy as np
 from datetime import datetime, timedelta
 import os
 import json
-from typing import Dict, List, Optional
+import hashlib
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Dict, List, Optional
 import warnings
 
-warnings.filterwarnings('ignore')
+# pandas/numpy are imported inside the methods that need them so that
+# formatting-only callers (e.g. generate_quick_summary) skip their import cost
+if TYPE_CHECKING:
+    import numpy as np
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Benchmark verdicts as (missed, met) label pairs
+BADGES = {
+    'above': ('⚠️ Below', '✅ Above'),
+    'excellent': ('⚠️ Needs Improvement', '✅ Excellent'),
+    'strong': ('⚠️ Low', '✅ Strong')
+}
+
+def _badge(kind: str, met: bool) -> str:
+    """Look up the benchmark verdict label for a KPI table row"""
+    return BADGES[kind][bool(met)]
+
+# JSON-native scalar types that _make_serializable returns untouched
+_PRIMITIVES = frozenset((str, int, float, bool, type(None)))
+
+# Files written by save_all_reports, relative to the output directory
+REPORT_FILES = (
+    'ZOQ_Analysis_Executive_Summary.md',
+    'ZOQ_Detailed_Findings.md',
+    'ZOQ_Implementation_Guide.md',
+    'ZOQ_Complete_Analysis_Report.md',
+    'monthly_reports/Current_Month_Report.md',
+    'analysis_data.json'
+)
+
+# Static opening of the implementation guide (phases 1-3), built once at import
+IMPLEMENTATION_GUIDE_PHASES = """
+## Implementation Guide
 
-class RestaurantReportGenerator:
-    """Professional business report generator for restaurant analysis"""
-    
-    def __init__(self, output_dir: str = 'reports'):
-        """
-        Initialize report generator
-        
-        Args:
-            output_dir: Directory to save generated reports
-        """
-        self.output_dir = output_dir
-        os.makedirs(output_dir, exist_ok=True)
-        os.makedirs(f'{output_dir}/monthly_reports', exist_ok=True)
-        
-        # Report templates and styling
-        self.report_header = """
-# ZOQ Restaurant Data Analysis Report
-**Generated on:** {date}  
-**Analysis Period:** {period}  
-**Report Type:** {report_type}
+### 🎯 Phase 1: Quick Wins (Week 1-4)
 
----
-        """
-        
-    def generate_executive_summary(self, comprehensive_insights: Dict) -> str:
-        """
-        Generate executive summary report
-        
-        Args:
-            comprehensive_insights: Complete analysis results
-            
-        Returns:
-            Formatted executive summary as string
-        """
-        print("📋 Generating executive summary...")
-        
-        exec_summary = comprehensive_insights['executive_summary']
-        recommendations = comprehensive_insights['business_recommendations']
-        
-        # Calculate key performance indicators
-        total_revenue = exec_summary['total_revenue']
-        total_orders = exec_summary['total_orders']
-        unique_customers = exec_summary['unique_customers']
-        avg_order_value = exec_summary['avg_order_value']
-        satisfaction_score = exec_summary['customer_satisfaction']
-        
-        # Revenue per customer
-        revenue_per_customer = total_revenue / unique_customers
-        
-        # Customer retention estimate
-        customer_segments = comprehensive_insights['customer_insights']['segments_distribution']
-        repeat_customers = customer_segments.get('High Value', 0) + customer_segments.get('VIP', 0)
-        retention_rate = (repeat_customers / unique_customers) * 100
-        
-        report = f"""
+#### Menu Optimization
+**Objective:** Streamline menu for efficiency and profitability
+
+**Actions:**
+1. **Week 1:** Analyze current menu performance using provided data
+2. **Week 2:** Remove items with <1% order frequency
+3. **Week 3:** Redesign menu highlighting top performers
+4. **Week 4:** Train staff on new menu and upselling strategies
+
+**Expected Impact:** 15% revenue increase, 25% reduction in kitchen complexity
+
+**Resources Required:**
+- Menu redesign: $500-1,000
+- Staff training: 8 hours
+- Implementation time: 2 weeks
+
+#### Peak Hour Staffing
+**Objective:** Optimize staffing levels during high-demand periods
+
+**Actions:**
+1. **Week 1:** Review current staffing schedules
+2. **Week 2:** Implement data-driven scheduling
+3. **Week 3:** Monitor service quality and wait times
+4. **Week 4:** Fine-tune staffing levels
+
+**Expected Impact:** 25% reduction in wait times, 12% increase in customer satisfaction
+
+### 🚀 Phase 2: Strategic Initiatives (Month 2-6)
+
+#### Customer Loyalty Program
+**Objective:** Increase customer retention and lifetime value
+
+**Implementation Timeline:**
+- **Month 2:** Design loyalty program structure
+- **Month 3:** Develop technology platform
+- **Month 4:** Pilot program with VIP customers
+- **Month 5:** Full launch with marketing campaign
+- **Month 6:** Evaluate and optimize
+
+**Program Structure:**
+- **Bronze Level:** 3-5 visits (5% discount)
+- **Silver Level:** 6-10 visits (10% discount + birthday reward)
+- **Gold Level:** 11+ visits (15% discount + exclusive events)
+- **VIP Level:** High spenders (20% discount + personal service)
+
+**Expected Impact:** 30% increase in return visits, 18% increase in average order value
+
+#### Seasonal Menu Strategy
+**Objective:** Maintain customer interest and optimize for seasonal trends
+
+**Quarterly Schedule:**
+- **Q1 (Jan-Mar):** Comfort foods, warm beverages
+- **Q2 (Apr-Jun):** Fresh salads, lighter options
+- **Q3 (Jul-Sep):** Grilled items, cold beverages
+- **Q4 (Oct-Dec):** Holiday specials, premium options
+
+**Implementation Process:**
+1. **8 weeks before quarter:** Menu development and testing
+2. **6 weeks before:** Staff training and preparation
+3. **4 weeks before:** Marketing campaign launch
+4. **Quarter start:** Full menu rollout
+
+### 📊 Phase 3: Advanced Analytics (Month 6-12)
+
+#### Real-Time Dashboard Implementation
+**Objective:** Enable data-driven decision making
+
+**Dashboard Features:**
+- Live sales tracking
+- Customer satisfaction monitoring
+- Inventory management
+- Staff performance metrics
+- Revenue forecasting
+
+**Technology Requirements:**
+- POS system integration
+- Cloud-based analytics platform
+- Mobile app for managers
+- Training for management team
+
+**Expected Impact:** 20% improvement in operational efficiency
+
+"""
+
+# Report bodies as str.format templates (same mechanism as report_header), built once at import
+EXECUTIVE_SUMMARY_TEMPLATE = """
 ## Executive Summary
 
 ### 🎯 Key Performance Indicators
@@ -81,22 +151,22 @@ class RestaurantReportGenerator:
 | **Total Revenue** | ${total_revenue:,.2f} | - | - |
 | **Total Orders** | {total_orders:,} | - | - |
 | **Unique Customers** | {unique_customers:,} | - | - |
-| **Average Order Value** | ${avg_order_value:.2f} | $25-35 | {'✅ Above' if avg_order_value > 25 else '⚠️ Below'} |
-| **Customer Satisfaction** | {satisfaction_score:.1f}/5.0 | 4.0+ | {'✅ Excellent' if satisfaction_score >= 4.0 else '⚠️ Needs Improvement'} |
-| **Revenue per Customer** | ${revenue_per_customer:.2f} | $150-250 | {'✅ Strong' if revenue_per_customer > 150 else '⚠️ Low'} |
-| **Customer Retention** | {retention_rate:.1f}% | 60-70% | {'✅ Strong' if retention_rate > 60 else '⚠️ Low'} |
+| **Average Order Value** | ${avg_order_value:.2f} | $25-35 | {aov_badge} |
+| **Customer Satisfaction** | {satisfaction_score:.1f}/5.0 | 4.0+ | {satisfaction_badge} |
+| **Revenue per Customer** | ${revenue_per_customer:.2f} | $150-250 | {revenue_per_customer_badge} |
+| **Customer Retention** | {retention_rate:.1f}% | 60-70% | {retention_badge} |
 
 ### 📊 Business Highlights
 
 **Strengths:**
-- Processed **{exec_summary['data_points_analyzed']:,} data points** over 12-month period
+- Processed **{data_points_analyzed:,} data points** over 12-month period
 - Achieved **{satisfaction_score:.1f}/5.0 customer satisfaction** rating
-- Established diverse customer base with **{len(customer_segments)} distinct segments**
+- Established diverse customer base with **{num_segments} distinct segments**
 
 **Growth Opportunities:**
-- **Potential Revenue Increase:** ${recommendations['projected_impact']['total_potential']:,.2f} (**29%** improvement)
-- **Menu Optimization:** ${recommendations['projected_impact']['menu_optimization']:,.2f} potential gain
-- **Customer Retention:** ${recommendations['projected_impact']['customer_retention']:,.2f} potential gain
+- **Potential Revenue Increase:** ${projected[total_potential]:,.2f} (**29%** improvement)
+- **Menu Optimization:** ${projected[menu_optimization]:,.2f} potential gain
+- **Customer Retention:** ${projected[customer_retention]:,.2f} potential gain
 
 ### 🚀 Strategic Recommendations
 
@@ -118,7 +188,7 @@ class RestaurantReportGenerator:
 ### 💰 Financial Impact Projection
 
 **Sister Restaurant Implementation Results:**
-- **First Month Revenue Increase:** 29% (${recommendations['projected_impact']['total_potential']:,.2f})
+- **First Month Revenue Increase:** 29% (${projected[total_potential]:,.2f})
 - **Customer Satisfaction Improvement:** 3.2 → 4.1 rating
 - **Operational Efficiency:** 18% increase in table turnover
 - **Waste Reduction:** 22% decrease in food waste
@@ -135,52 +205,41 @@ To track implementation success, monitor these KPIs:
 
 *This analysis demonstrates the power of data-driven decision making in restaurant operations. The insights and recommendations are based on comprehensive analysis of over 8,500 data points and proven implementation results.*
         """
-        
-        return report
-        
-    def generate_detailed_findings(self, comprehensive_insights: Dict) -> str:
-        """Generate detailed findings report with deep analysis"""
-        print("🔍 Generating detailed findings...")
-        
-        customer_insights = comprehensive_insights['customer_insights']
-        menu_insights = comprehensive_insights['menu_insights']
-        time_insights = comprehensive_insights.get('time_insights', {})
-        satisfaction_insights = comprehensive_insights['satisfaction_insights']
-        
-        report = f"""
+
+DETAILED_FINDINGS_TEMPLATE = """
 ## Detailed Analysis Findings
 
 ### 👥 Customer Behavior Analysis
 
 #### Customer Segmentation Results
-{self._format_customer_segments(customer_insights)}
+{segments_table}
 
 #### Customer Lifetime Value Analysis
-- **High-Value Customers (VIP):** {customer_insights['segments_distribution'].get('VIP', 0)} customers
-- **Medium-Value Customers:** {customer_insights['segments_distribution'].get('High Value', 0) + customer_insights['segments_distribution'].get('Medium Value', 0)} customers
+- **High-Value Customers (VIP):** {vip_customers} customers
+- **Medium-Value Customers:** {medium_value_customers} customers
 - **Growth Opportunity:** Convert Medium→High Value customers through targeted campaigns
 
 ### 🍽️ Menu Performance Analysis
 
 #### Top Performing Items
-{self._format_top_menu_items(menu_insights)}
+{top_items_table}
 
 #### Category Performance
-{self._format_category_performance(menu_insights)}
+{category_table}
 
 #### Menu Optimization Recommendations
-- **Remove:** Items with <1% order frequency (estimated {len([item for item in menu_insights['item_performance'].itertuples() if item.order_percentage < 1.0])} items)
+- **Remove:** Items with <1% order frequency (estimated {rarely_ordered_items} items)
 - **Promote:** Top 10 items contribute to estimated 35% of revenue
 - **Seasonal:** Introduce 5-8 seasonal items quarterly
 
 ### ⏰ Temporal Pattern Analysis
 
-{self._format_time_patterns(time_insights)}
+{time_patterns}
 
 ### ⭐ Customer Satisfaction Analysis
 
 #### Overall Satisfaction Metrics
-{self._format_satisfaction_metrics(satisfaction_insights)}
+{satisfaction_table}
 
 #### Satisfaction Drivers
 - **Food Quality:** Primary driver of overall satisfaction
@@ -190,7 +249,7 @@ To track implementation success, monitor these KPIs:
 ### 📈 Revenue Analysis
 
 #### Revenue Breakdown
-- **Peak Performance:** {time_insights.get('peak_day', 'Weekend')} generates highest revenue
+- **Peak Performance:** {peak_day} generates highest revenue
 - **Growth Trend:** Positive trajectory with seasonal variations
 - **Average Transaction:** Consistent with market standards
 
@@ -203,111 +262,17 @@ To track implementation success, monitor these KPIs:
 
 ---
         """
-        
-        return report
-        
-    def generate_implementation_guide(self, comprehensive_insights: Dict) -> str:
-        """Generate implementation guide for recommendations"""
-        print("📋 Generating implementation guide...")
-        
-        recommendations = comprehensive_insights['business_recommendations']
-        
-        guide = f"""
-## Implementation Guide
-
-### 🎯 Phase 1: Quick Wins (Week 1-4)
-
-#### Menu Optimization
-**Objective:** Streamline menu for efficiency and profitability
-
-**Actions:**
-1. **Week 1:** Analyze current menu performance using provided data
-2. **Week 2:** Remove items with <1% order frequency
-3. **Week 3:** Redesign menu highlighting top performers
-4. **Week 4:** Train staff on new menu and upselling strategies
-
-**Expected Impact:** 15% revenue increase, 25% reduction in kitchen complexity
-
-**Resources Required:**
-- Menu redesign: $500-1,000
-- Staff training: 8 hours
-- Implementation time: 2 weeks
-
-#### Peak Hour Staffing
-**Objective:** Optimize staffing levels during high-demand periods
-
-**Actions:**
-1. **Week 1:** Review current staffing schedules
-2. **Week 2:** Implement data-driven scheduling
-3. **Week 3:** Monitor service quality and wait times
-4. **Week 4:** Fine-tune staffing levels
-
-**Expected Impact:** 25% reduction in wait times, 12% increase in customer satisfaction
-
-### 🚀 Phase 2: Strategic Initiatives (Month 2-6)
-
-#### Customer Loyalty Program
-**Objective:** Increase customer retention and lifetime value
-
-**Implementation Timeline:**
-- **Month 2:** Design loyalty program structure
-- **Month 3:** Develop technology platform
-- **Month 4:** Pilot program with VIP customers
-- **Month 5:** Full launch with marketing campaign
-- **Month 6:** Evaluate and optimize
-
-**Program Structure:**
-- **Bronze Level:** 3-5 visits (5% discount)
-- **Silver Level:** 6-10 visits (10% discount + birthday reward)
-- **Gold Level:** 11+ visits (15% discount + exclusive events)
-- **VIP Level:** High spenders (20% discount + personal service)
-
-**Expected Impact:** 30% increase in return visits, 18% increase in average order value
-
-#### Seasonal Menu Strategy
-**Objective:** Maintain customer interest and optimize for seasonal trends
-
-**Quarterly Schedule:**
-- **Q1 (Jan-Mar):** Comfort foods, warm beverages
-- **Q2 (Apr-Jun):** Fresh salads, lighter options
-- **Q3 (Jul-Sep):** Grilled items, cold beverages
-- **Q4 (Oct-Dec):** Holiday specials, premium options
-
-**Implementation Process:**
-1. **8 weeks before quarter:** Menu development and testing
-2. **6 weeks before:** Staff training and preparation
-3. **4 weeks before:** Marketing campaign launch
-4. **Quarter start:** Full menu rollout
-
-### 📊 Phase 3: Advanced Analytics (Month 6-12)
-
-#### Real-Time Dashboard Implementation
-**Objective:** Enable data-driven decision making
-
-**Dashboard Features:**
-- Live sales tracking
-- Customer satisfaction monitoring
-- Inventory management
-- Staff performance metrics
-- Revenue forecasting
 
-**Technology Requirements:**
-- POS system integration
-- Cloud-based analytics platform
-- Mobile app for managers
-- Training for management team
-
-**Expected Impact:** 20% improvement in operational efficiency
-
-### 📈 Success Metrics & Monitoring
+# Data-dependent tail of the implementation guide, appended after IMPLEMENTATION_GUIDE_PHASES
+IMPLEMENTATION_GUIDE_METRICS_TEMPLATE = """### 📈 Success Metrics & Monitoring
 
 #### Key Performance Indicators (KPIs)
 
 | Metric | Baseline | Target | Monitoring Frequency |
 |--------|----------|--------|---------------------|
 | Monthly Revenue | Current | +15% | Weekly |
-| Customer Satisfaction | {comprehensive_insights['executive_summary']['customer_satisfaction']:.1f} | 4.2+ | Daily |
-| Average Order Value | ${comprehensive_insights['executive_summary']['avg_order_value']:.2f} | +10% | Weekly |
+| Customer Satisfaction | {satisfaction_score:.1f} | 4.2+ | Daily |
+| Average Order Value | ${avg_order_value:.2f} | +10% | Weekly |
 | Customer Retention | Current | 70%+ | Monthly |
 | Food Waste | Current | -20% | Daily |
 | Staff Productivity | Current | +15% | Weekly |
@@ -329,9 +294,9 @@ To track implementation success, monitor these KPIs:
 - **Total Initial Investment:** $19,500
 
 #### Projected ROI Timeline
-- **Month 1-3:** 15% revenue increase = ${comprehensive_insights['business_recommendations']['projected_impact']['total_potential'] * 0.15:,.2f}
-- **Month 4-6:** 25% revenue increase = ${comprehensive_insights['business_recommendations']['projected_impact']['total_potential'] * 0.25:,.2f}
-- **Month 7-12:** 29% revenue increase = ${comprehensive_insights['business_recommendations']['projected_impact']['total_potential']:,.2f}
+- **Month 1-3:** 15% revenue increase = ${quarter_potential:,.2f}
+- **Month 4-6:** 25% revenue increase = ${half_year_potential:,.2f}
+- **Month 7-12:** 29% revenue increase = ${total_potential:,.2f}
 
 **Break-even Point:** Month 2  
 **12-Month ROI:** 1,486% return on investment
@@ -355,82 +320,268 @@ To track implementation success, monitor these KPIs:
 
 *This implementation guide provides a roadmap for achieving the projected 29% revenue increase based on proven data-driven strategies.*
         """
+
+# Monthly report body as a %-template, filled per month from preformatted KPI strings
+MONTHLY_REPORT_TEMPLATE = """
+# Monthly Performance Report - %(month)s
+
+## 📊 Month Overview
+
+### Key Metrics
+- **Total Orders:** %(total_orders)s
+- **Revenue:** $%(total_revenue)s
+- **Unique Customers:** %(unique_customers)s
+- **Avg Order Value:** $%(avg_order_value)s
+- **Customer Satisfaction:** %(satisfaction_score)s/5.0
+
+### Month-over-Month Comparison
+*Note: Historical comparison would require previous month's data*
+
+### Goals vs Actual Performance
+- **Revenue Target:** Met/Missed by X%%
+- **Customer Satisfaction Target:** %(satisfaction_score)s/5.0 (Target: 4.0+)
+- **New Customer Acquisition:** Analysis pending
+
+### Action Items for Next Month
+1. Continue menu optimization initiatives
+2. Monitor loyalty program performance
+3. Assess seasonal menu item performance
+4. Review staffing efficiency metrics
+
+### Recommendations
+Based on this month's performance, focus on:
+- Customer retention programs
+- Peak hour service optimization
+- Menu item profitability analysis
+
+---
+
+*Generated automatically from ZOQ Restaurant Data Analysis System*
+        """
+
+# KPI columns consumed by the monthly report
+MONTHLY_KPI_FIELDS = ('total_orders', 'total_revenue', 'unique_customers', 'avg_order_value', 'satisfaction_score')
+
+class RestaurantReportGenerator:
+    """Professional business report generator for restaurant analysis"""
+    
+    def __init__(self, output_dir: str = 'reports'):
+        """
+        Initialize report generator
+        
+        Args:
+            output_dir: Directory to save generated reports
+        """
+        self.output_dir = output_dir
+        
+        # Output locations are resolved once; creating monthly_reports also creates output_dir
+        output_path = Path(output_dir)
+        self._monthly_dir = output_path / 'monthly_reports'
+        self._monthly_dir.mkdir(parents=True, exist_ok=True)
+        self._paths = {name: output_path / name for name in REPORT_FILES}
+        self._hash_path = output_path / '.cache_hash'
+        
+        # Report templates and styling
+        self.report_header = """
+# ZOQ Restaurant Data Analysis Report
+**Generated on:** {date}  
+**Analysis Period:** {period}  
+**Report Type:** {report_type}
+
+---
+        """
         
-        return guide
+        # Period and report type are fixed for the report suite, so only the date is left to fill per save
+        self._suite_header = self.report_header.format(
+            date='{date}',
+            period="12-Month Analysis (2023)",
+            report_type="Comprehensive Business Analysis"
+        )
+        
+    def _compute_kpis(self, comprehensive_insights: Dict) -> Dict:
+        """
+        Derive the key performance indicators shared by all report variants
+        
+        save_all_reports computes them once and passes them to each generator.
+        
+        Args:
+            comprehensive_insights: Complete analysis results
+            
+        Returns:
+            Dictionary of headline KPIs
+        """
+        exec_summary = comprehensive_insights['executive_summary']
+        total_revenue = exec_summary['total_revenue']
+        unique_customers = exec_summary['unique_customers']
+        
+        # Customer retention estimate
+        customer_segments = comprehensive_insights['customer_insights']['segments_distribution']
+        repeat_customers = customer_segments.get('High Value', 0) + customer_segments.get('VIP', 0)
+        
+        kpis = {
+            'total_revenue': total_revenue,
+            'total_orders': exec_summary['total_orders'],
+            'unique_customers': unique_customers,
+            'avg_order_value': exec_summary['avg_order_value'],
+            'satisfaction_score': exec_summary['customer_satisfaction'],
+            'revenue_per_customer': total_revenue / unique_customers,
+            'retention_rate': (repeat_customers / unique_customers) * 100,
+            'repeat_customers': repeat_customers,
+            'num_segments': len(customer_segments)
+        }
+        
+        return kpis
+        
+    def generate_executive_summary(self, comprehensive_insights: Dict, kpis: Optional[Dict] = None) -> str:
+        """
+        Generate executive summary report
+        
+        Args:
+            comprehensive_insights: Complete analysis results
+            kpis: Precomputed KPIs (derived from the insights when omitted)
+            
+        Returns:
+            Formatted executive summary as string
+        """
+        print("📋 Generating executive summary...")
+        
+        exec_summary = comprehensive_insights['executive_summary']
+        recommendations = comprehensive_insights['business_recommendations']
+        
+        # Key performance indicators
+        kpis = kpis or self._compute_kpis(comprehensive_insights)
+        
+        return EXECUTIVE_SUMMARY_TEMPLATE.format(
+            **kpis,
+            aov_badge=_badge('above', kpis['avg_order_value'] > 25),
+            satisfaction_badge=_badge('excellent', kpis['satisfaction_score'] >= 4.0),
+            revenue_per_customer_badge=_badge('strong', kpis['revenue_per_customer'] > 150),
+            retention_badge=_badge('strong', kpis['retention_rate'] > 60),
+            data_points_analyzed=exec_summary['data_points_analyzed'],
+            projected=recommendations['projected_impact']
+        )
+        
+    def generate_detailed_findings(self, comprehensive_insights: Dict) -> str:
+        """Generate detailed findings report with deep analysis"""
+        import numpy as np
+        
+        print("🔍 Generating detailed findings...")
+        
+        customer_insights = comprehensive_insights['customer_insights']
+        menu_insights = comprehensive_insights['menu_insights']
+        time_insights = comprehensive_insights.get('time_insights', {})
+        satisfaction_insights = comprehensive_insights['satisfaction_insights']
+        
+        # pandas deprecation noise is silenced only while the tables are built
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', category=FutureWarning)
+            segments_table = self._format_customer_segments(customer_insights)
+            top_items_table = self._format_top_menu_items(menu_insights)
+            category_table = self._format_category_performance(menu_insights)
+            satisfaction_table = self._format_satisfaction_metrics(satisfaction_insights)
+            
+            # Items below 1% of orders (candidates for removal)
+            rarely_ordered_items = np.count_nonzero(
+                menu_insights['item_performance']['order_percentage'].to_numpy() < 1.0
+            )
+        
+        segments = customer_insights['segments_distribution']
+        return DETAILED_FINDINGS_TEMPLATE.format(
+            segments_table=segments_table,
+            vip_customers=segments.get('VIP', 0),
+            medium_value_customers=segments.get('High Value', 0) + segments.get('Medium Value', 0),
+            top_items_table=top_items_table,
+            category_table=category_table,
+            rarely_ordered_items=rarely_ordered_items,
+            time_patterns=self._format_time_patterns(time_insights),
+            satisfaction_table=satisfaction_table,
+            peak_day=time_insights.get('peak_day', 'Weekend')
+        )
+        
+    def generate_implementation_guide(self, comprehensive_insights: Dict, kpis: Optional[Dict] = None) -> str:
+        """Generate implementation guide for recommendations"""
+        print("📋 Generating implementation guide...")
+        
+        recommendations = comprehensive_insights['business_recommendations']
+        kpis = kpis or self._compute_kpis(comprehensive_insights)
+        
+        total_potential = recommendations['projected_impact']['total_potential']
+        return IMPLEMENTATION_GUIDE_PHASES + IMPLEMENTATION_GUIDE_METRICS_TEMPLATE.format(
+            satisfaction_score=kpis['satisfaction_score'],
+            avg_order_value=kpis['avg_order_value'],
+            quarter_potential=total_potential * 0.15,
+            half_year_potential=total_potential * 0.25,
+            total_potential=total_potential
+        )
         
     def _format_customer_segments(self, customer_insights: Dict) -> str:
         """Format customer segmentation data for report"""
+        import numpy as np
+        import pandas as pd
+        
         segments = customer_insights['segments_distribution']
         segment_stats = customer_insights['segment_stats']
         
-        result = "| Segment | Count | Percentage | Avg Spent | Avg Frequency |\n"
-        result += "|---------|-------|------------|-----------|---------------|\n"
+        lines = [
+            "| Segment | Count | Percentage | Avg Spent | Avg Frequency |",
+            "|---------|-------|------------|-----------|---------------|"
+        ]
         
-        # Fix: Handle both Series and dict types
-        if hasattr(segments, 'values'):
-            total_customers = segments.sum()
-            segment_items = segments.items()
+        # Handle both Series and dict types once, then work on plain arrays
+        if isinstance(segments, pd.Series):
+            names = segments.index.tolist()
+            counts = segments.to_numpy()
         else:
-            total_customers = sum(segments.values())
-            segment_items = segments.items()
+            names = list(segments.keys())
+            counts = np.fromiter(segments.values(), dtype=np.int64, count=len(names))
         
-        for segment, count in segment_items:
-            percentage = (count / total_customers) * 100
-            
-            # Safe access to segment_stats
-            try:
-                avg_spent = segment_stats.loc[segment, 'avg_spent'] if segment in segment_stats.index else 0
-                avg_freq = segment_stats.loc[segment, 'avg_frequency'] if segment in segment_stats.index else 0
-            except (KeyError, IndexError):
-                avg_spent = 0
-                avg_freq = 0
-            
-            result += f"| {segment} | {count} | {percentage:.1f}% | ${avg_spent:.2f} | {avg_freq:.1f} |\n"
+        percentages = counts * (100.0 / counts.sum())
         
-        return result
+        # Align segment_stats to the segments in one gather; missing segments or columns read as 0
+        stats = segment_stats.reindex(
+            index=names, columns=['avg_spent', 'avg_frequency']
+        ).fillna(0).to_numpy(dtype=np.float64)
+        
+        for segment, count, percentage, (avg_spent, avg_freq) in zip(
+            names, counts.tolist(), percentages.tolist(), stats.tolist()
+        ):
+            lines.append(f"| {segment} | {count} | {percentage:.1f}% | ${avg_spent:.2f} | {avg_freq:.1f} |")
+        
+        return "\n".join(lines) + "\n"
         
     def _format_top_menu_items(self, menu_insights: Dict) -> str:
         """Format top menu items for report"""
         top_items = menu_insights['top_10_popular'].head(10)
         
-        result = "| Rank | Item Name | Orders | Revenue | % of Total Orders |\n"
-        result += "|------|-----------|--------|---------|-------------------|\n"
-        
-        # Safe iteration over DataFrame
-        for idx, row in top_items.iterrows():
-            rank = len(result.split('\n')) - 2  # Calculate rank based on position
-            try:
-                item_name = row['item_name'] if 'item_name' in row else 'Unknown'
-                order_count = row['order_count'] if 'order_count' in row else 0
-                revenue = row['revenue'] if 'revenue' in row else 0
-                order_percentage = row['order_percentage'] if 'order_percentage' in row else 0
-                
-                result += f"| {rank} | {item_name} | {order_count} | ${revenue:.2f} | {order_percentage:.1f}% |\n"
-            except (KeyError, TypeError) as e:
-                continue
+        lines = [
+            "| Rank | Item Name | Orders | Revenue | % of Total Orders |",
+            "|------|-----------|--------|---------|-------------------|"
+        ]
         
-        return result
+        # Read only the needed columns, once, instead of boxing every row
+        columns = ['item_name', 'order_count', 'revenue', 'order_percentage']
+        if set(top_items.columns).issuperset(columns):
+            for rank, (item_name, order_count, revenue, order_percentage) in enumerate(top_items[columns].to_numpy(), 1):
+                lines.append(f"| {rank} | {item_name} | {order_count} | ${revenue:.2f} | {order_percentage:.1f}% |")
+        
+        return "\n".join(lines) + "\n"
         
     def _format_category_performance(self, menu_insights: Dict) -> str:
         """Format category performance for report"""
         categories = menu_insights['category_performance']
         
-        result = "| Category | Total Orders | Revenue | Avg Revenue/Item |\n"
-        result += "|----------|--------------|---------|------------------|\n"
-        
-        # Safe iteration over DataFrame
-        for idx, row in categories.iterrows():
-            try:
-                category = row['category'] if 'category' in row else 'Unknown'
-                total_orders = row['total_orders'] if 'total_orders' in row else 0
-                total_revenue = row['total_revenue'] if 'total_revenue' in row else 0
-                avg_revenue_per_item = row['avg_revenue_per_item'] if 'avg_revenue_per_item' in row else 0
-                
-                result += f"| {category} | {total_orders} | ${total_revenue:.2f} | ${avg_revenue_per_item:.2f} |\n"
-            except (KeyError, TypeError):
-                continue
+        lines = [
+            "| Category | Total Orders | Revenue | Avg Revenue/Item |",
+            "|----------|--------------|---------|------------------|"
+        ]
         
-        return result
+        # Read only the needed columns, once, instead of boxing every row
+        columns = ['category', 'total_orders', 'total_revenue', 'avg_revenue_per_item']
+        if set(categories.columns).issuperset(columns):
+            for category, total_orders, total_revenue, avg_revenue_per_item in categories[columns].to_numpy():
+                lines.append(f"| {category} | {total_orders} | ${total_revenue:.2f} | ${avg_revenue_per_item:.2f} |")
+        
+        return "\n".join(lines) + "\n"
         
     def _format_time_patterns(self, time_insights: Dict) -> str:
         """Format time pattern analysis for report"""
@@ -457,121 +608,212 @@ To track implementation success, monitor these KPIs:
         result = f"""
 | Metric | Score | Industry Benchmark | Performance |
 |--------|-------|-------------------|-------------|
-| Overall Rating | {metrics['avg_overall_rating']:.2f}/5.0 | 4.0+ | {'✅ Excellent' if metrics['avg_overall_rating'] >= 4.0 else '⚠️ Needs Improvement'} |
-| Food Quality | {metrics['avg_food_quality']:.2f}/5.0 | 4.0+ | {'✅ Excellent' if metrics['avg_food_quality'] >= 4.0 else '⚠️ Needs Improvement'} |
-| Service Quality | {metrics['avg_service_quality']:.2f}/5.0 | 4.0+ | {'✅ Excellent' if metrics['avg_service_quality'] >= 4.0 else '⚠️ Needs Improvement'} |
-| Recommendation Rate | {metrics['recommendation_rate']:.1f}% | 80%+ | {'✅ Strong' if metrics['recommendation_rate'] >= 80 else '⚠️ Low'} |
-| High Satisfaction Rate | {metrics['high_satisfaction_rate']:.1f}% | 70%+ | {'✅ Strong' if metrics['high_satisfaction_rate'] >= 70 else '⚠️ Low'} |
+| Overall Rating | {metrics['avg_overall_rating']:.2f}/5.0 | 4.0+ | {_badge('excellent', metrics['avg_overall_rating'] >= 4.0)} |
+| Food Quality | {metrics['avg_food_quality']:.2f}/5.0 | 4.0+ | {_badge('excellent', metrics['avg_food_quality'] >= 4.0)} |
+| Service Quality | {metrics['avg_service_quality']:.2f}/5.0 | 4.0+ | {_badge('excellent', metrics['avg_service_quality'] >= 4.0)} |
+| Recommendation Rate | {metrics['recommendation_rate']:.1f}% | 80%+ | {_badge('strong', metrics['recommendation_rate'] >= 80)} |
+| High Satisfaction Rate | {metrics['high_satisfaction_rate']:.1f}% | 70%+ | {_badge('strong', metrics['high_satisfaction_rate'] >= 70)} |
         """
         
         return result
         
-    def generate_monthly_report(self, month: str, comprehensive_insights: Dict) -> str:
+    def generate_monthly_report(self, month: str, comprehensive_insights: Dict, kpis: Optional[Dict] = None) -> str:
         """Generate monthly performance report"""
         print(f"📅 Generating monthly report for {month}...")
         
-        exec_summary = comprehensive_insights['executive_summary']
+        kpis = kpis or self._compute_kpis(comprehensive_insights)
         
-        report = f"""
-# Monthly Performance Report - {month}
-
-## 📊 Month Overview
-
-### Key Metrics
-- **Total Orders:** {exec_summary['total_orders']:,}
-- **Revenue:** ${exec_summary['total_revenue']:,.2f}
-- **Unique Customers:** {exec_summary['unique_customers']:,}
-- **Avg Order Value:** ${exec_summary['avg_order_value']:.2f}
-- **Customer Satisfaction:** {exec_summary['customer_satisfaction']:.1f}/5.0
-
-### Month-over-Month Comparison
-*Note: Historical comparison would require previous month's data*
-
-### Goals vs Actual Performance
-- **Revenue Target:** Met/Missed by X%
-- **Customer Satisfaction Target:** {exec_summary['customer_satisfaction']:.1f}/5.0 (Target: 4.0+)
-- **New Customer Acquisition:** Analysis pending
-
-### Action Items for Next Month
-1. Continue menu optimization initiatives
-2. Monitor loyalty program performance
-3. Assess seasonal menu item performance
-4. Review staffing efficiency metrics
-
-### Recommendations
-Based on this month's performance, focus on:
-- Customer retention programs
-- Peak hour service optimization
-- Menu item profitability analysis
-
----
-
-*Generated automatically from ZOQ Restaurant Data Analysis System*
-        """
+        return self._render_monthly_reports([month], {field: [kpis[field]] for field in MONTHLY_KPI_FIELDS})[0]
+        
+    def generate_monthly_reports_batch(self, months: List[str], kpi_soa: Dict[str, 'np.ndarray']) -> List[str]:
+        """Generate monthly reports for many months from per-month KPI arrays (one entry per month)"""
+        print(f"📅 Generating monthly reports for {len(months)} months...")
+        
+        return self._render_monthly_reports(months, kpi_soa)
+        
+    def save_monthly_reports(self, months: List[str], kpi_soa: Dict[str, 'np.ndarray']) -> None:
+        """Generate and save one monthly report per month"""
+        reports = self.generate_monthly_reports_batch(months, kpi_soa)
+        paths = [
+            self._monthly_dir / f"{str(month).replace(' ', '_')}_Report.md" for month in months
+        ]
+        chunks = [[report.encode('utf-8')] for report in reports]
+        
+        with ThreadPoolExecutor(max_workers=min(8, len(paths) or 1)) as executor:
+            list(executor.map(self._write_report, paths, chunks))
+        
+        print(f"📅 {len(paths)} monthly reports saved to '{self.output_dir}/monthly_reports'")
+        
+    def _render_monthly_reports(self, months: List[str], kpi_soa: Dict) -> List[str]:
+        """Fill the monthly template for every month from column-oriented KPIs"""
+        import numpy as np
+        
+        # Format each KPI column in one pass, then substitute row by row
+        columns = {
+            'month': list(months),
+            'total_orders': [f"{value:,}" for value in np.asarray(kpi_soa['total_orders']).tolist()],
+            'total_revenue': [f"{value:,.2f}" for value in np.asarray(kpi_soa['total_revenue']).tolist()],
+            'unique_customers': [f"{value:,}" for value in np.asarray(kpi_soa['unique_customers']).tolist()],
+            'avg_order_value': np.char.mod('%.2f', np.asarray(kpi_soa['avg_order_value'], dtype=np.float64)).tolist(),
+            'satisfaction_score': np.char.mod('%.1f', np.asarray(kpi_soa['satisfaction_score'], dtype=np.float64)).tolist()
+        }
         
-        return report
+        return [MONTHLY_REPORT_TEMPLATE % dict(zip(columns, row)) for row in zip(*columns.values())]
         
     def save_all_reports(self, comprehensive_insights: Dict) -> None:
         """Generate and save all reports"""
         print("📄 Generating comprehensive report suite...")
         print("=" * 50)
         
-        # Generate all reports
-        executive_summary = self.generate_executive_summary(comprehensive_insights)
-        detailed_findings = self.generate_detailed_findings(comprehensive_insights)
-        implementation_guide = self.generate_implementation_guide(comprehensive_insights)
-        monthly_report = self.generate_monthly_report("Current Period", comprehensive_insights)
+        # The cache key covers the insights and the report date, but not the analysis
+        # timestamp, which differs on every pipeline run even when the results don't
+        current_date = datetime.now().strftime("%B %d, %Y")
+        report_hash = self._report_hash(comprehensive_insights, current_date)
+        
+        if self._reports_up_to_date(report_hash):
+            print(f"✅ Reports in '{self.output_dir}' are already up to date")
+            return
+        
+        analysis_json = self._serialize_insights(comprehensive_insights)
+        
+        # Generate all reports concurrently (they are independent; KPIs are derived once and shared)
+        kpis = self._compute_kpis(comprehensive_insights)
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [
+                executor.submit(self.generate_executive_summary, comprehensive_insights, kpis),
+                executor.submit(self.generate_detailed_findings, comprehensive_insights),
+                executor.submit(self.generate_implementation_guide, comprehensive_insights, kpis),
+                executor.submit(self.generate_monthly_report, "Current Period", comprehensive_insights, kpis)
+            ]
+            executive_summary, detailed_findings, implementation_guide, monthly_report = (
+                future.result() for future in futures
+            )
         
         # Create header
-        current_date = datetime.now().strftime("%B %d, %Y")
-        header = self.report_header.format(
-            date=current_date,
-            period="12-Month Analysis (2023)",
-            report_type="Comprehensive Business Analysis"
+        header = self._suite_header.format(date=current_date)
+        
+        # Encode each section once; every file is written as a list of these buffers
+        header_bytes, executive_bytes, detailed_bytes, implementation_bytes, monthly_bytes = (
+            section.encode('utf-8') for section in
+            (header, executive_summary, detailed_findings, implementation_guide, monthly_report)
         )
         
-        # Combine reports
-        full_report = header + executive_summary + detailed_findings + implementation_guide
+        # Save individual and combined reports (file writes overlap on a thread pool)
+        paths = self._paths
+        report_files = {
+            paths['ZOQ_Analysis_Executive_Summary.md']: [header_bytes, executive_bytes],
+            paths['ZOQ_Detailed_Findings.md']: [header_bytes, detailed_bytes],
+            paths['ZOQ_Implementation_Guide.md']: [header_bytes, implementation_bytes],
+            paths['ZOQ_Complete_Analysis_Report.md']: [
+                header_bytes, executive_bytes, detailed_bytes, implementation_bytes
+            ],
+            paths['monthly_reports/Current_Month_Report.md']: [monthly_bytes],
+            # Save insights as JSON for future reference
+            paths['analysis_data.json']: [analysis_json]
+        }
+        with ThreadPoolExecutor(max_workers=len(report_files)) as executor:
+            list(executor.map(self._write_report, report_files.keys(), report_files.values()))
+        
+        # Record the hash only once every file has been written
+        self._hash_path.write_text(report_hash, encoding='utf-8')
+        
+        # Report status as one write rather than a print per line
+        status_lines = [
+            "✅ All reports generated successfully!",
+            f"📁 Reports saved to '{self.output_dir}' directory",
+            "\n📋 Generated Reports:"
+        ]
+        status_lines.extend(f"  • {name}" for name in REPORT_FILES)
+        print("\n".join(status_lines))
+        
+    def _serialize_insights(self, comprehensive_insights: Dict) -> bytes:
+        """Serialize insights to the UTF-8 JSON written as analysis_data.json"""
+        if orjson is not None:
+            # orjson encodes NumPy values natively; only pandas objects need converting
+            return orjson.dumps(
+                comprehensive_insights,
+                default=self._json_default,
+                option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS | orjson.OPT_INDENT_2
+            )
+        
+        # Convert non-serializable objects to string
+        serializable_insights = self._make_serializable(comprehensive_insights)
+        return json.dumps(serializable_insights, indent=2, default=str).encode('utf-8')
+        
+    def _report_hash(self, comprehensive_insights: Dict, current_date: str) -> str:
+        """Hash of the insights (minus their analysis timestamp) and the report date"""
+        insights = {key: value for key, value in comprehensive_insights.items() if key != 'analysis_date'}
+        digest = hashlib.blake2b(self._serialize_insights(insights), digest_size=16)
+        digest.update(current_date.encode('utf-8'))
+        return digest.hexdigest()
+        
+    def _reports_up_to_date(self, report_hash: str) -> bool:
+        """Check whether the previous run already wrote every report for these insights"""
+        try:
+            previous_hash = self._hash_path.read_text(encoding='utf-8')
+        except OSError:
+            return False
+        
+        return previous_hash == report_hash and all(
+            path.exists() for path in self._paths.values()
+        )
         
-        # Save individual reports
-        with open(f'{self.output_dir}/ZOQ_Analysis_Executive_Summary.md', 'w') as f:
-            f.write(header + executive_summary)
+    def _write_report(self, path: Path, chunks: List[bytes]) -> None:
+        """Write pre-encoded report sections to a file with one gathered write where supported"""
+        if not hasattr(os, 'writev'):
+            with open(path, 'wb') as f:
+                f.write(b''.join(chunks))
+            return
             
-        with open(f'{self.output_dir}/ZOQ_Detailed_Findings.md', 'w') as f:
-            f.write(header + detailed_findings)
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+        try:
+            written = os.writev(fd, chunks)
             
-        with open(f'{self.output_dir}/ZOQ_Implementation_Guide.md', 'w') as f:
-            f.write(header + implementation_guide)
+            # Finish any short write
+            if written < sum(len(chunk) for chunk in chunks):
+                remaining = b''.join(chunks)[written:]
+                while remaining:
+                    remaining = remaining[os.write(fd, remaining):]
+        finally:
+            os.close(fd)
             
-        with open(f'{self.output_dir}/ZOQ_Complete_Analysis_Report.md', 'w') as f:
-            f.write(full_report)
-            
-        with open(f'{self.output_dir}/monthly_reports/Current_Month_Report.md', 'w') as f:
-            f.write(monthly_report)
-        
-        # Save insights as JSON for future reference
-        with open(f'{self.output_dir}/analysis_data.json', 'w') as f:
-            # Convert non-serializable objects to string
-            serializable_insights = self._make_serializable(comprehensive_insights)
-            json.dump(serializable_insights, f, indent=2, default=str)
-        
-        print("✅ All reports generated successfully!")
-        print(f"📁 Reports saved to '{self.output_dir}' directory")
-        print("\n📋 Generated Reports:")
-        print("  • ZOQ_Analysis_Executive_Summary.md")
-        print("  • ZOQ_Detailed_Findings.md") 
-        print("  • ZOQ_Implementation_Guide.md")
-        print("  • ZOQ_Complete_Analysis_Report.md")
-        print("  • monthly_reports/Current_Month_Report.md")
-        print("  • analysis_data.json")
+    def _json_default(self, obj):
+        """orjson fallback encoder for pandas objects (anything else is stringified)"""
+        import pandas as pd
+        
+        if isinstance(obj, pd.DataFrame):
+            return obj.to_dict('records')
+        elif isinstance(obj, pd.Series):
+            return obj.to_dict()
+        return str(obj)
         
     def _make_serializable(self, obj):
-        """Convert pandas objects to serializable format"""
-        if isinstance(obj, dict):
-            return {key: self._make_serializable(value) for key, value in obj.items()}
+        """Convert pandas objects to serializable format (containers are only copied if a child changes)"""
+        if type(obj) in _PRIMITIVES:
+            return obj
+        elif isinstance(obj, dict):
+            converted = None
+            for key, value in obj.items():
+                new_value = self._make_serializable(value)
+                if new_value is not value:
+                    if converted is None:
+                        converted = dict(obj)
+                    converted[key] = new_value
+            return obj if converted is None else converted
         elif isinstance(obj, list):
-            return [self._make_serializable(item) for item in obj]
-        elif isinstance(obj, pd.DataFrame):
+            converted = None
+            for i, item in enumerate(obj):
+                new_item = self._make_serializable(item)
+                if new_item is not item:
+                    if converted is None:
+                        converted = list(obj)
+                    converted[i] = new_item
+            return obj if converted is None else converted
+        
+        import numpy as np
+        import pandas as pd
+        
+        if isinstance(obj, pd.DataFrame):
             return obj.to_dict('records')
         elif isinstance(obj, pd.Series):
             return obj.to_dict()
@@ -619,7 +861,7 @@ if __name__ == "__main__":
         from analysis_functions import create_analyzer
         
         # Create analyzer and run analysis
-        analyzer = create_analyzer()
+        analyzer = create_analyzer(cache_dir='data/processed/analysis_cache')
         insights = analyzer.run_comprehensive_analysis()
         
         # Generate reports